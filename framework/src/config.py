@@ -2,6 +2,16 @@ import os
 from dataclasses import dataclass
 from typing import Optional
 
+_TRUE = frozenset({"true", "1", "yes", "on", "y"})
+
+# On-disk caches live under framework/data regardless of the working directory
+_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+
+def _env_bool(name: str, default: str = 'false') -> bool:
+    """Read an environment variable as a boolean flag"""
+    return os.getenv(name, default).strip().lower() in _TRUE
+
 @dataclass
 class ExternalServiceConfig:
     """Configuration for external services"""
@@ -28,6 +38,12 @@ class SecurityConfig:
     session_secret: str = "default_session_secret_key"
     jwt_secret: str = "default_jwt_secret_key"
 
+@dataclass
+class CacheConfig:
+    """Cache configuration"""
+    # An empty path keeps AI responses cached in memory only
+    ai_response_cache_path: str = os.path.join(_DATA_DIR, 'ai_cache.db')
+
 @dataclass
 class ApplicationConfig:
     """Application configuration"""
@@ -81,8 +97,12 @@ class Config:
             jwt_secret=os.getenv('JWT_SECRET', 'default_jwt_secret_key')
         )
         
+        self.cache = CacheConfig(
+            ai_response_cache_path=os.getenv('AI_RESPONSE_CACHE_PATH', os.path.join(_DATA_DIR, 'ai_cache.db'))
+        )
+        
         self.application = ApplicationConfig(
-            debug=os.getenv('DEBUG', 'false').lower() == 'true',
+            debug=_env_bool('DEBUG'),
             log_level=os.getenv('LOG_LEVEL', 'INFO'),
             workers=int(os.getenv('WORKERS', '2')),
             host=os.getenv('HOST', '0.0.0.0'),
@@ -6,7 +6,7 @@ from src.models.persona import Persona, PersonaUsage
 from src.services.ai_content import (
     PersonaGenerator, AIContentGenerator, 
     IndustryType, ExperienceLevel,
-    PersonaGeneratorSync, AIContentGeneratorSync
+    get_persona_generator_sync, get_content_generator_sync
 )
 
 logger = logging.getLogger(__name__)
@@ -33,7 +33,7 @@ def generate_persona():
             return jsonify({'error': f'Invalid experience level: {experience_str}'}), 400
         
         # Generate persona
-        generator = PersonaGeneratorSync()
+        generator = get_persona_generator_sync()
         persona_profile = generator.generate_professional_persona(industry, experience_level)
         
         # Store persona in database
@@ -256,7 +256,7 @@ def generate_content():
         )
         
         # Generate content
-        generator = AIContentGeneratorSync()
+        generator = get_content_generator_sync()
         result = generator.generate_professional_content(content_type, persona)
         
         # Return result
@@ -411,7 +411,7 @@ def enhance_persona():
         )
         
         # Generate enhancements based on type
-        generator = AIContentGeneratorSync()
+        generator = get_content_generator_sync()
         enhancements = {}
         
         if enhancement_type == 'content':
@@ -452,7 +452,7 @@ def test_ai_services():
     """Test AI services connectivity"""
     try:
         # Test OpenAI connectivity
-        generator = AIContentGeneratorSync()
+        generator = get_content_generator_sync()
         
         # Create a simple test persona
         from src.services.ai_content import PersonaProfile, DemographicData, ProfessionalData, SkillsData, ContentData, VisualAssets
@@ -59,6 +59,7 @@ try:
           ]
   
   AI_AVAILABLE = True
+  _AI_IMPORT_ERROR = None
 except Exception as e:
   AIBrowserAgent = None  # type: ignore
   LinkedInAIEngine = None  # type: ignore
@@ -66,10 +67,14 @@ except Exception as e:
   AISessionRegistry = None  # type: ignore
   AISession = None  # type: ignore
   AI_AVAILABLE = False
+  _AI_IMPORT_ERROR = e
 
 logger = logging.getLogger(__name__)
 automation_bp = Blueprint('automation', __name__)
 
+if _AI_IMPORT_ERROR is not None:
+  logger.warning(f"AI automation disabled, optional imports failed: {_AI_IMPORT_ERROR!r}")
+
 # Registry for live AI sessions
 _ai_sessions = AISessionRegistry() if AI_AVAILABLE else None
 
@@ -9,6 +9,9 @@ from .ai_browser_agent import AIBrowserAgent
 
 logger = logging.getLogger(__name__)
 
+# Dedicated generator so pacing jitter doesn't contend on the global `random` lock
+_rand = random.Random()
+
 
 class AccountWarmupService:
     def __init__(self, browser_agent: AIBrowserAgent):
@@ -54,9 +57,9 @@ class AccountWarmupService:
 
                 await self.browser.run_task(prompt)
 
-                await asyncio.sleep(random.uniform(1.0, 3.0))
                 results.append({"activity": activity, "success": True, "timestamp": datetime.utcnow().isoformat()})
-                await asyncio.sleep(random.uniform(0.5, 1.5))
+                # Single 1.5-4.5s pause between activities (same bounds as the former two draws)
+                await asyncio.sleep(1.5 + 3.0 * _rand.random())
             except Exception as exc:  # pragma: no cover
                 results.append({"activity": activity, "success": False, "error": str(exc), "timestamp": datetime.utcnow().isoformat()})
 
@@ -2,15 +2,148 @@ import asyncio
 import logging
 import os
 import random
-from typing import Any, Dict, Optional
+import threading
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
 
-from .ai_config import get_skyvern_client, AIOperationType
+import aiohttp
+
+from .ai_config import AIOperationType
 from .session_manager import get_session_manager, SessionStatus
 from .ai_error_handler import get_error_handler
 
 
 logger = logging.getLogger(__name__)
 
+# Process-wide admission control for browser session creation, so concurrent
+# agents queue locally instead of racing each other into the provider quota.
+# asyncio primitives are loop-bound and callers run under per-request loops,
+# hence one semaphore per event loop.
+_MAX_CONCURRENT_SESSION_STARTS = int(os.getenv('SKYVERN_MAX_CONCURRENT_SESSIONS', '2'))
+_session_start_sems: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def _session_start_semaphore() -> asyncio.Semaphore:
+    """Get the session-start semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    sem = _session_start_sems.get(loop)
+    if sem is None:
+        sem = asyncio.Semaphore(_MAX_CONCURRENT_SESSION_STARTS)
+        _session_start_sems[loop] = sem
+    return sem
+
+
+# Minimum spacing between session creations. Slots are reserved under a
+# thread lock so pacing holds across per-request loops, and the first start
+# after an idle period goes straight through.
+_MIN_SESSION_START_INTERVAL = float(os.getenv('SKYVERN_MIN_SESSION_INTERVAL', '2.5'))
+_session_start_lock = threading.Lock()
+_next_session_start = 0.0
+
+
+async def _pace_session_start() -> None:
+    """Wait until this caller's session-start slot comes up."""
+    global _next_session_start
+    with _session_start_lock:
+        now = time.monotonic()
+        slot = max(now, _next_session_start)
+        _next_session_start = slot + _MIN_SESSION_START_INTERVAL
+    if slot > now:
+        await asyncio.sleep(slot - now)
+
+
+# Per-agent limits on Skyvern task submission
+_MAX_CONCURRENT_TASKS = int(os.getenv('SKYVERN_MAX_CONCURRENT', '2'))
+_MIN_TASK_INTERVAL = float(os.getenv('SKYVERN_MIN_TASK_INTERVAL', '0.5'))
+
+
+# HTTP statuses worth retrying against the Skyvern API
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+
+# Task submission is not idempotent: after a gateway 502/504 Skyvern may
+# already have accepted the task, so only retry statuses that mean it was refused
+TASK_SUBMIT_RETRYABLE_STATUSES = frozenset({429, 503})
+
+# Capped exponential backoff: base * 2**attempt, jittered x0.5-1.5, never under a second
+_RETRY_BASE = 1.0
+_RETRY_CAP = 30.0
+_RETRY_FLOOR = 1.0
+_RETRY_ATTEMPTS = 3
+
+_rand = random.Random()
+
+
+async def _with_retry(coro_factory: Callable[[], Awaitable[Any]], *,
+                      attempts: int = _RETRY_ATTEMPTS,
+                      base: float = _RETRY_BASE,
+                      cap: float = _RETRY_CAP,
+                      statuses: frozenset = RETRYABLE_STATUSES) -> Any:
+    """Await coro_factory(), retrying retryable HTTP errors with capped, jittered backoff."""
+    for attempt in range(attempts):
+        try:
+            return await coro_factory()
+        except aiohttp.ClientResponseError as exc:
+            if exc.status not in statuses or attempt == attempts - 1:
+                raise
+            delay = max(_RETRY_FLOOR, min(cap, base * 2 ** attempt) * _rand.uniform(0.5, 1.5))
+            retry_after = exc.headers.get('Retry-After') if exc.headers else None
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, min(cap, float(retry_after)))
+            logger.warning(f"Retryable HTTP {exc.status} (attempt {attempt + 1}/{attempts}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+
+# Remote browser-session closes scheduled by cleanup(); see drain_cleanups()
+_pending_cleanups: Set[asyncio.Task] = set()
+
+
+async def _close_remote_session(session_manager, skyvern_client, session_id: str, skyvern_session_id: str) -> None:
+    """Close the Skyvern browser session behind a managed session."""
+    try:
+        await skyvern_client.close_browser_session(browser_session_id=skyvern_session_id)
+    except Exception as e:
+        # Leave skyvern_session_id set so the session manager's sweep retries the close
+        logger.warning(f"Deferred close of Skyvern session {skyvern_session_id} failed: {e}")
+        return
+    session_manager.update_session(session_id, skyvern_session_id=None)
+    logger.info(f"Closed Skyvern session {skyvern_session_id}")
+
+
+async def drain_cleanups() -> None:
+    """Wait for this loop's scheduled remote session closes.
+
+    asyncio.run cancels tasks still pending when its coroutine returns, so
+    coroutines that call cleanup() await this before they finish.
+    """
+    loop = asyncio.get_running_loop()
+    pending = [task for task in _pending_cleanups if task.get_loop() is loop]
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+def _release_abandoned_session(session_manager, skyvern_client, session_id: str) -> None:
+    """Finalizer for agents collected without an explicit cleanup."""
+    logger.warning(f"AIBrowserAgent destroyed without explicit cleanup for session {session_id}")
+    session_meta = session_manager.get_session(session_id)
+    session_manager.close_session(session_id)
+    if not session_meta or not session_meta.skyvern_session_id:
+        return
+    skyvern_session_id = session_meta.skyvern_session_id
+    # Free the remote browser now rather than leaving it for the expiry sweep
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        try:
+            skyvern_client.close_browser_session_sync(skyvern_session_id)
+            session_manager.update_session(session_id, skyvern_session_id=None)
+        except Exception as e:
+            logger.warning(f"Best-effort close of Skyvern session {skyvern_session_id} failed: {e}")
+        return
+    task = loop.create_task(_close_remote_session(session_manager, skyvern_client, session_id, skyvern_session_id))
+    _pending_cleanups.add(task)
+    task.add_done_callback(_pending_cleanups.discard)
+
 
 class AIBrowserAgent:
     """
@@ -18,6 +151,11 @@ class AIBrowserAgent:
     Exposes a minimal API used by higher-level services.
     """
 
+    __slots__ = (
+        'account_id', 'session_id', 'live_url', 'session_manager', 'error_handler',
+        'skyvern_client', '_finalizer', '_task_sem', '_next_task_at', '__weakref__',
+    )
+
     def __init__(self, account_id: Optional[str] = None):
         self.account_id = account_id
         self.session_id: Optional[str] = None
@@ -26,7 +164,18 @@ class AIBrowserAgent:
         # Initialize managers
         self.session_manager = get_session_manager()
         self.error_handler = get_error_handler()
-        self.skyvern_client = get_skyvern_client()
+        # Share the manager's client so session creation, tasks and close all
+        # go through one keep-alive connection pool
+        self.skyvern_client = self.session_manager.skyvern_client
+        self._finalizer: Optional[weakref.finalize] = None
+        self._task_sem = asyncio.Semaphore(_MAX_CONCURRENT_TASKS)
+        self._next_task_at = 0.0
+
+    async def __aenter__(self) -> "AIBrowserAgent":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.cleanup()
 
     async def initialize(self) -> bool:
         """Initialize a new browser session using the session manager."""
@@ -34,10 +183,12 @@ class AIBrowserAgent:
             logger.info(f"Initializing AI browser session for account {self.account_id}")
             
             # Create a new session via the session manager
-            managed_session_id = await self.session_manager.create_session(
-                account_id=self.account_id,
-                operation_type=AIOperationType.BROWSER_AUTOMATION
-            )
+            async with _session_start_semaphore():
+                await _pace_session_start()
+                managed_session_id = await self.session_manager.create_session(
+                    account_id=self.account_id,
+                    operation_type=AIOperationType.BROWSER_AUTOMATION
+                )
             
             session_meta = self.session_manager.get_session(managed_session_id)
             if not session_meta:
@@ -45,6 +196,13 @@ class AIBrowserAgent:
                 
             self.session_id = managed_session_id
             self.live_url = session_meta.live_url
+
+            # Release the session if this agent is garbage-collected without cleanup
+            if self._finalizer:
+                self._finalizer.detach()
+            self._finalizer = weakref.finalize(
+                self, _release_abandoned_session, self.session_manager, self.skyvern_client, self.session_id
+            )
             
             self.session_manager.set_session_status(self.session_id, SessionStatus.ACTIVE)
             
@@ -71,11 +229,12 @@ class AIBrowserAgent:
             raise Exception("Session not found or skyvern_session_id is missing")
 
         try:
-            task_result = await self.skyvern_client.run_task(
-                browser_session_id=session_meta.skyvern_session_id,
-                prompt=prompt
-            )
-            return task_result
+            async with self._task_sem:
+                await self._pace_task()
+                return await _with_retry(lambda: self.skyvern_client.run_task(
+                    browser_session_id=session_meta.skyvern_session_id,
+                    prompt=prompt
+                ), statuses=TASK_SUBMIT_RETRYABLE_STATUSES)
         except Exception as e:
             logger.error(f"Error running task: {e}")
             self.error_handler.handle_error(
@@ -86,6 +245,14 @@ class AIBrowserAgent:
             )
             raise
 
+    async def _pace_task(self) -> None:
+        """Keep task submissions from this agent at least _MIN_TASK_INTERVAL apart."""
+        now = time.monotonic()
+        slot = max(now, self._next_task_at)
+        self._next_task_at = slot + _MIN_TASK_INTERVAL
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
     async def navigate_to_linkedin(self) -> bool:
         """Navigate to LinkedIn using a Skyvern task."""
         try:
@@ -114,9 +281,21 @@ class AIBrowserAgent:
     async def cleanup(self) -> None:
         """Clean up the browser session."""
         try:
+            if self._finalizer:
+                self._finalizer.detach()
+                self._finalizer = None
             if self.session_id:
                 logger.info(f"Cleaning up AI browser session: {self.session_id}")
+                session_meta = self.session_manager.get_session(self.session_id)
                 self.session_manager.close_session(self.session_id)
+                if session_meta and session_meta.skyvern_session_id:
+                    # Close the remote browser in the background instead of blocking the caller
+                    task = asyncio.get_running_loop().create_task(_close_remote_session(
+                        self.session_manager, self.skyvern_client,
+                        self.session_id, session_meta.skyvern_session_id
+                    ))
+                    _pending_cleanups.add(task)
+                    task.add_done_callback(_pending_cleanups.discard)
                 self.session_id = None
                 self.live_url = None
         except Exception as e:
@@ -127,11 +306,3 @@ class AIBrowserAgent:
                 account_id=self.account_id,
                 operation_type='browser_automation'
             )
-        
-    def __del__(self):
-        """Ensure cleanup is called when object is destroyed."""
-        if self.session_id:
-            logger.warning(f"AIBrowserAgent destroyed without explicit cleanup for session {self.session_id}")
-            # Note: Can't call async cleanup from __del__, but log the issue
-
-
@@ -3,14 +3,52 @@ AI Configuration Module for GPT-5 Integration
 Provides centralized configuration, validation, and optimization for AI services.
 """
 
+import asyncio
+import functools
 import os
 import logging
-from typing import Dict, Any, Optional, List
+import time
+import urllib.request
+from typing import AsyncGenerator, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+import aiohttp
+from yarl import URL
+
+from . import jsonutil
+
 logger = logging.getLogger(__name__)
 
+# How long a successful close is remembered so repeated closes of the same
+# browser session (agent cleanup, expiry sweep, retries) skip the round trip
+_CLOSE_CACHE_TTL = 5.0
+
+# Environment variables snapshotted by AIConfigManager; see refresh_env()
+_ENV_KEYS = (
+    'OPENAI_API_KEY',
+    'BROWSERBASE_API_KEY',
+    'BROWSERBASE_PROJECT_ID',
+    'SKYVERN_API_KEY',
+    'SKYVERN_WORKSPACE_ID',
+)
+
+# Shared by every JSON-mode config; kept a plain dict so it stays JSON-serializable
+_JSON_OBJECT_FORMAT = {"type": "json_object"}
+
+# GPT-5 capabilities are fixed, so share one dict rather than rebuilding it per call
+_MODEL_CAPABILITIES: Dict[str, Any] = {
+    "context_window": 128000,  # GPT-5 context window
+    "max_output_tokens": 4096,
+    "supports_json_mode": True,
+    "supports_function_calling": True,
+    "supports_vision": True,
+    "rate_limits": {
+        "requests_per_minute": 500,
+        "tokens_per_minute": 150000
+    }
+}
+
 
 class AIOperationType(Enum):
     """Types of AI operations with different configuration requirements."""
@@ -22,7 +60,7 @@ class AIOperationType(Enum):
     DEBUG_ANALYSIS = "debug_analysis"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GPT5Config:
     """GPT-5 specific configuration parameters."""
     model: str = "gpt-5"
@@ -39,12 +77,27 @@ class GPT5Config:
 class AIConfigManager:
     """Centralized AI configuration and validation manager."""
     
+    __slots__ = (
+        'api_key', 'model_configs', '_env', '_openai_params_cache',
+        '_retry_config_cache', '_stagehand_headers',
+    )
+    
     def __init__(self):
         self.api_key = None
         self.model_configs = {}
+        self._env: Dict[str, Optional[str]] = {}
+        self.refresh_env()
         self._initialize_configs()
         self._validate_environment()
     
+    def refresh_env(self):
+        """Re-read the environment variables used by the AI services."""
+        self._env = {name: os.environ.get(name) for name in _ENV_KEYS}
+    
+    def get_env(self, name: str) -> Optional[str]:
+        """Get an AI-related environment variable from the cached snapshot."""
+        return self._env.get(name)
+    
     def _initialize_configs(self):
         """Initialize optimized configurations for different AI operations."""
         
@@ -55,7 +108,7 @@ class AIConfigManager:
             max_tokens=500,
             timeout=45,
             retry_attempts=2,
-            response_format={"type": "json_object"}
+            response_format=_JSON_OBJECT_FORMAT
         )
         
         # Content Generation: Creative but controlled
@@ -75,7 +128,7 @@ class AIConfigManager:
             max_tokens=1200,
             timeout=75,
             retry_attempts=3,
-            response_format={"type": "json_object"}
+            response_format=_JSON_OBJECT_FORMAT
         )
         
         # Session Management: Quick decisions
@@ -94,7 +147,7 @@ class AIConfigManager:
             max_tokens=400,
             timeout=45,
             retry_attempts=3,
-            response_format={"type": "json_object"}
+            response_format=_JSON_OBJECT_FORMAT
         )
         
         # Debug Analysis: Detailed investigation
@@ -105,100 +158,116 @@ class AIConfigManager:
             timeout=90,
             retry_attempts=2
         )
+        
+        self._build_param_caches()
+    
+    def _build_param_caches(self):
+        """Precompute the per-operation request and retry parameter dicts."""
+        self._openai_params_cache: Dict[AIOperationType, Dict[str, Any]] = {}
+        self._retry_config_cache: Dict[AIOperationType, Dict[str, Any]] = {}
+        for operation_type, config in self.model_configs.items():
+            params = {
+                "model": config.model,
+                "temperature": config.temperature,
+                "max_tokens": config.max_tokens,
+                "presence_penalty": config.presence_penalty,
+                "frequency_penalty": config.frequency_penalty,
+                "top_p": config.top_p,
+                "timeout": config.timeout
+            }
+            
+            # Add response format if specified
+            if config.response_format:
+                params["response_format"] = config.response_format
+            
+            self._openai_params_cache[operation_type] = params
+            self._retry_config_cache[operation_type] = {
+                "max_retries": config.retry_attempts,
+                "exponential_base": 2,
+                "jitter": True,
+                "max_delay": 60
+            }
     
     def _validate_environment(self):
         """Validate environment variables and API key configuration."""
         
         # Check for OpenAI API key
-        self.api_key = os.getenv('OPENAI_API_KEY')
+        self.api_key = self._env['OPENAI_API_KEY']
         if not self.api_key:
             logger.error("OPENAI_API_KEY environment variable is not set")
             raise ValueError("OpenAI API key is required for AI operations")
         
         # Validate API key format
-        if not self.api_key.startswith(('sk-', 'sk-proj-')):
+        if not self.api_key.startswith('sk-'):  # also covers 'sk-proj-' keys
             logger.warning("OpenAI API key format appears invalid")
         
+        self._stagehand_headers = {
+            'x-model-api-key': self.api_key,
+            'Content-Type': 'application/json'
+        }
+        
         # Log configuration status
         logger.info("AI Configuration Manager initialized successfully")
-        logger.info(f"Using model: {self.get_config(AIOperationType.BROWSER_AUTOMATION).model}")
-        logger.info(f"API key configured: {'***' + self.api_key[-8:] if len(self.api_key) > 8 else '***'}")
+        logger.info("Using model: %s", self.get_config(AIOperationType.BROWSER_AUTOMATION).model)
+        logger.info("API key configured: ***%s", self.api_key[-8:] if len(self.api_key) > 8 else '')
     
     def get_config(self, operation_type: AIOperationType) -> GPT5Config:
         """Get optimized configuration for specific AI operation type."""
-        return self.model_configs.get(operation_type, self.model_configs[AIOperationType.BROWSER_AUTOMATION])
+        # Every operation type has a config, so the fallback lookup only runs for unknown keys
+        return self.model_configs.get(operation_type) or self.model_configs[AIOperationType.BROWSER_AUTOMATION]
     
     def get_openai_params(self, operation_type: AIOperationType, **overrides) -> Dict[str, Any]:
         """Get OpenAI API parameters for specific operation type."""
-        config = self.get_config(operation_type)
-        
-        params = {
-            "model": config.model,
-            "temperature": config.temperature,
-            "max_tokens": config.max_tokens,
-            "presence_penalty": config.presence_penalty,
-            "frequency_penalty": config.frequency_penalty,
-            "top_p": config.top_p,
-            "timeout": config.timeout
-        }
-        
-        # Add response format if specified
-        if config.response_format:
-            params["response_format"] = config.response_format
-        
-        # Apply any overrides
-        params.update(overrides)
-        
-        return params
+        base = (self._openai_params_cache.get(operation_type)
+                or self._openai_params_cache[AIOperationType.BROWSER_AUTOMATION])
+        return {**base, **overrides} if overrides else base.copy()
     
     def get_retry_config(self, operation_type: AIOperationType) -> Dict[str, Any]:
         """Get retry configuration for specific operation type."""
-        config = self.get_config(operation_type)
-        return {
-            "max_retries": config.retry_attempts,
-            "exponential_base": 2,
-            "jitter": True,
-            "max_delay": 60
-        }
+        base = (self._retry_config_cache.get(operation_type)
+                or self._retry_config_cache[AIOperationType.BROWSER_AUTOMATION])
+        return base.copy()
     
     def validate_api_key_for_stagehand(self) -> Dict[str, str]:
         """Get validated headers for Stagehand server communication."""
         if not self.api_key:
             raise ValueError("OpenAI API key not configured")
         
-        return {
-            'x-model-api-key': self.api_key,
-            'Content-Type': 'application/json'
-        }
+        return self._stagehand_headers
     
     def get_model_capabilities(self) -> Dict[str, Any]:
         """Get GPT-5 model capabilities and limitations."""
-        return {
-            "context_window": 128000,  # GPT-5 context window
-            "max_output_tokens": 4096,
-            "supports_json_mode": True,
-            "supports_function_calling": True,
-            "supports_vision": True,
-            "rate_limits": {
-                "requests_per_minute": 500,
-                "tokens_per_minute": 150000
-            }
-        }
+        return _MODEL_CAPABILITIES
     
     def log_usage_stats(self, operation_type: AIOperationType, tokens_used: int, duration: float):
         """Log AI operation usage statistics."""
-        logger.info(f"AI Operation: {operation_type.value} | Tokens: {tokens_used} | Duration: {duration:.2f}s")
-
+        logger.info("AI Operation: %s | Tokens: %d | Duration: %.2fs", operation_type.value, tokens_used, duration)
 
-# Global instance
-ai_config = AIConfigManager()
 
 class SkyvernClient:
     """Client for interacting with the Skyvern API."""
     
-    def __init__(self, api_url: str = "https://api.skyvern.com/v1"):
+    __slots__ = (
+        'api_url', 'api_key', 'workspace_id', '_headers', '_sessions_url', '_tasks_url',
+        '_request_timeout', '_close_timeout', '_session_timeout', '_sessions',
+        '_recently_closed',
+    )
+    
+    def __init__(self, api_url: str = "https://api.skyvern.com/v1", request_timeout: float = 120.0):
         self.api_url = api_url
-        self.ai_config = ai_config
+        # Endpoint URLs are parsed once; aiohttp uses URL objects as-is
+        self._sessions_url = URL(api_url) / 'browser_sessions'
+        self._tasks_url = URL(api_url) / 'run' / 'tasks'
+        # Per-call deadlines are enforced with asyncio.timeout() around the request
+        # and body read; the session only carries a separate connect budget so a
+        # stalled connect doesn't consume the whole request window.
+        self._request_timeout = request_timeout
+        self._close_timeout = 10.0
+        self._session_timeout = aiohttp.ClientTimeout(total=None, connect=10, sock_connect=10)
+        # One keep-alive session per event loop, with the async generator
+        # that closes it when that loop shuts down (see _get_session)
+        self._sessions: Dict[asyncio.AbstractEventLoop, Tuple[aiohttp.ClientSession, AsyncGenerator[None, None]]] = {}
+        self._recently_closed: Dict[str, float] = {}
         self._validate_initialization()
 
     def _validate_initialization(self):
@@ -214,51 +283,114 @@ class SkyvernClient:
             logger.error("SKYVERN_WORKSPACE_ID environment variable is missing")
             raise ValueError("SKYVERN_WORKSPACE_ID is required for Skyvern operations")
 
+        self._headers = {
+            'x-api-key': self.api_key,
+            'Content-Type': 'application/json'
+        }
+
         logger.info("SkyvernClient initialized with validated credentials")
-        logger.info(f"Skyvern API URL: {self.api_url}")
-        logger.info(f"Skyvern Workspace ID: {self.workspace_id}")
+        logger.info("Skyvern API URL: %s", self.api_url)
+        logger.info("Skyvern Workspace ID: %s", self.workspace_id)
 
     def get_headers(self) -> Dict[str, str]:
         """Get headers for Skyvern API requests."""
-        return {
-            'x-api-key': self.api_key,
-            'Content-Type': 'application/json'
-        }
+        return self._headers
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the keep-alive HTTP session for the running event loop."""
+        # Sessions are bound to the loop that created them and callers may run
+        # each request under its own asyncio.run loop, so keep one per loop.
+        loop = asyncio.get_running_loop()
+        entry = self._sessions.get(loop)
+        if entry is None or entry[0].closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=60, ttl_dns_cache=300),
+                headers=self._headers,
+                json_serialize=jsonutil.dumps,
+                timeout=self._session_timeout
+            )
+            # Started async generators are finalized by loop.shutdown_asyncgens(),
+            # which asyncio.run calls before closing the loop; the generator's
+            # finally block closes the session on its own loop.
+            closer = self._close_at_loop_shutdown(loop, session)
+            await closer.asend(None)
+            self._sessions[loop] = (session, closer)
+            return session
+        return entry[0]
+
+    async def _close_at_loop_shutdown(self, loop: asyncio.AbstractEventLoop,
+                                      session: aiohttp.ClientSession) -> AsyncGenerator[None, None]:
+        """Hold a loop's session open until the generator is closed."""
+        try:
+            yield
+        finally:
+            entry = self._sessions.get(loop)
+            if entry is not None and entry[0] is session:
+                del self._sessions[loop]
+            await session.close()
+
+    async def aclose(self) -> None:
+        """Close the HTTP session of the running event loop."""
+        entry = self._sessions.get(asyncio.get_running_loop())
+        if entry is not None:
+            await entry[1].aclose()
+
+    async def _post_json(self, url: URL, payload: Optional[Dict[str, Any]] = None,
+                         timeout: Optional[float] = None, read_body: bool = True) -> Optional[Dict[str, Any]]:
+        """POST to the Skyvern API and return the decoded JSON body, raising on HTTP errors."""
+        session = await self._get_session()
+        async with asyncio.timeout(timeout or self._request_timeout):
+            async with session.post(url, json=payload) as response:
+                response.raise_for_status()
+                if read_body:
+                    return jsonutil.loads(await response.read())
+                return None
 
     async def create_browser_session(self, timeout: int = 60) -> Dict[str, Any]:
         """Create a new browser session."""
-        import aiohttp
-        url = f"{self.api_url}/browser_sessions"
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=self.get_headers(), json={'timeout': timeout}) as response:
-                response.raise_for_status()
-                return await response.json()
+        return await self._post_json(self._sessions_url, {'timeout': timeout})
 
     async def run_task(self, browser_session_id: str, prompt: str) -> Dict[str, Any]:
         """Run a task in a browser session."""
-        import aiohttp
-        url = f"{self.api_url}/run/tasks"
         payload = {
             'prompt': prompt,
             'browser_session_id': browser_session_id
         }
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=self.get_headers(), json=payload) as response:
-                response.raise_for_status()
-                return await response.json()
+        return await self._post_json(self._tasks_url, payload)
 
     async def close_browser_session(self, browser_session_id: str) -> None:
         """Close a browser session."""
-        import aiohttp
-        url = f"{self.api_url}/browser_sessions/{browser_session_id}/close"
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=self.get_headers()) as response:
-                response.raise_for_status()
+        now = time.monotonic()
+        if now - self._recently_closed.get(browser_session_id, float('-inf')) < _CLOSE_CACHE_TTL:
+            logger.debug("Skyvern session %s already closed, skipping", browser_session_id)
+            return
+        url = self._sessions_url / browser_session_id / 'close'
+        await self._post_json(url, timeout=self._close_timeout, read_body=False)
+        self._mark_closed(browser_session_id)
+
+    def close_browser_session_sync(self, browser_session_id: str, timeout: float = 2.0) -> None:
+        """Close a browser session from code that has no running event loop."""
+        url = str(self._sessions_url / browser_session_id / 'close')
+        req = urllib.request.Request(url, data=b'', headers=self.get_headers(), method='POST')
+        # urlopen raises HTTPError for non-2xx responses
+        with urllib.request.urlopen(req, timeout=timeout):
+            pass
+        self._mark_closed(browser_session_id)
+
+    def _mark_closed(self, browser_session_id: str) -> None:
+        """Remember a successful close, dropping entries older than the TTL."""
+        now = time.monotonic()
+        self._recently_closed = {
+            sid: ts for sid, ts in self._recently_closed.items() if now - ts < _CLOSE_CACHE_TTL
+        }
+        self._recently_closed[browser_session_id] = now
 
+@functools.lru_cache(maxsize=1)
 def get_ai_config() -> AIConfigManager:
-    """Get the global AI configuration manager instance."""
-    return ai_config
+    """Get the global AI configuration manager instance, created on first use."""
+    return AIConfigManager()
 
+@functools.lru_cache(maxsize=1)
 def get_skyvern_client() -> SkyvernClient:
-    """Get a validated Skyvern client instance."""
+    """Get the shared, validated Skyvern client instance."""
     return SkyvernClient()
@@ -1,17 +1,346 @@
 import openai
+import httpx
 import asyncio
 import logging
+import os
 import random
 import json
+import functools
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+import uuid
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from typing import AsyncGenerator, Optional, List, Dict, Any
 from enum import Enum
 from datetime import datetime
 
 from src.config import config
+from . import jsonutil
 
 logger = logging.getLogger(__name__)
 
+class _ResponseCache:
+    """Thread-safe LRU cache of completion texts with a per-entry TTL."""
+
+    def __init__(self, max_entries: int = 1000, ttl_seconds: float = 24 * 3600):
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+_response_cache = _ResponseCache()
+
+# On-disk second tier so cached completions survive restarts; the path comes
+# from config.cache (AI_RESPONSE_CACHE_PATH, empty for memory only). Expired
+# rows are purged when the cache opens and then at most once per interval.
+_RESPONSE_CACHE_TTL = 24 * 3600
+_RESPONSE_CACHE_PURGE_INTERVAL = 3600
+
+
+class _SqliteCacheBackend:
+    """Persistent key/value store for completions, shared across processes."""
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._lock = threading.Lock()
+        self._next_purge = 0.0
+        self._purge_expired()
+
+    def _purge_expired(self):
+        """Delete expired rows; callers hold the lock or own the backend."""
+        now = time.time()
+        self._conn.execute("DELETE FROM responses WHERE expires_at < ?", (now,))
+        self._next_purge = now + _RESPONSE_CACHE_PURGE_INTERVAL
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM responses WHERE key = ? AND expires_at > ?", (key, time.time())
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str, ttl: float = _RESPONSE_CACHE_TTL):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, time.time() + ttl)
+            )
+            if time.time() >= self._next_purge:
+                self._purge_expired()
+
+
+def _open_persistent_cache() -> Optional[_SqliteCacheBackend]:
+    """Open the on-disk response cache, or None if disabled or unavailable"""
+    path = config.cache.ai_response_cache_path
+    if not path:
+        return None
+    try:
+        return _SqliteCacheBackend(path)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"Persistent response cache unavailable, using memory only: {e}")
+        return None
+
+
+_persistent_cache: Optional[_SqliteCacheBackend] = None
+_persistent_cache_opened = False
+_persistent_cache_lock = threading.Lock()
+
+
+def _get_persistent_cache() -> Optional[_SqliteCacheBackend]:
+    """Open the on-disk response cache on first use (blocking; call off the event loop)"""
+    global _persistent_cache, _persistent_cache_opened
+    if not _persistent_cache_opened:
+        with _persistent_cache_lock:
+            if not _persistent_cache_opened:
+                _persistent_cache = _open_persistent_cache()
+                _persistent_cache_opened = True
+    return _persistent_cache
+
+
+def _persistent_get(key: str) -> Optional[str]:
+    backend = _get_persistent_cache()
+    return backend.get(key) if backend is not None else None
+
+
+def _persistent_set(key: str, value: str):
+    backend = _get_persistent_cache()
+    if backend is not None:
+        backend.set(key, value)
+
+# Process-wide OpenAI request/token budget and per-client concurrency cap, so
+# bursts queue locally under the account's rate limits instead of drawing 429s
+_OPENAI_MAX_RPM = int(os.getenv('OPENAI_MAX_RPM', '10000'))
+_OPENAI_MAX_TPM = int(os.getenv('OPENAI_MAX_TPM', '2000000'))
+_OPENAI_MAX_CONCURRENCY = int(os.getenv('OPENAI_MAX_CONCURRENCY', '100'))
+
+
+class _RateLimiter:
+    """Requests-per-minute and tokens-per-minute token buckets.
+
+    Capacity is reserved under a thread lock, since callers run under
+    per-request event loops; buckets may go negative so waiters queue in order.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self._rpm = requests_per_minute
+        self._tpm = tokens_per_minute
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    async def acquire(self, tokens: int):
+        """Wait until one request and the estimated tokens fit in the budget."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._updated = now
+            self._requests = min(self._rpm, self._requests + elapsed * self._rpm / 60)
+            self._tokens = min(self._tpm, self._tokens + elapsed * self._tpm / 60)
+            self._requests -= 1
+            self._tokens -= min(tokens, self._tpm)
+            wait = max(0.0, -self._requests * 60 / self._rpm, -self._tokens * 60 / self._tpm)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+_rate_limiter = _RateLimiter(_OPENAI_MAX_RPM, _OPENAI_MAX_TPM)
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds the API asked us to wait in a 429 response, if it said"""
+    if not isinstance(error, openai.RateLimitError):
+        return None
+    headers = error.response.headers
+    try:
+        if "retry-after-ms" in headers:
+            return float(headers["retry-after-ms"]) / 1000
+        return float(headers["retry-after"])
+    except (KeyError, ValueError):
+        return None
+
+# Smaller model for structured, low-creativity calls (JSON backgrounds and
+# skills, hashtags); profile texts keep the full model
+_FAST_MODEL = "gpt-5-mini"
+_JSON_OBJECT_FORMAT = {"type": "json_object"}
+
+
+def _prompt_cache_key(step: str, industry: Optional[str], experience_level: "ExperienceLevel") -> str:
+    """OpenAI prompt_cache_key grouping similar requests onto one cache shard"""
+    if industry:
+        return f"{step}:{industry}:{experience_level.value}"
+    return f"{step}:{experience_level.value}"
+
+# Batch API jobs finish within a 24h window; poll their status at this interval
+_BATCH_COMPLETION_WINDOW = "24h"
+_BATCH_POLL_INTERVAL = 30.0
+_BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+# Give up on a batch this long after submission (the window plus an hour of
+# grace) and cancel it; a cancelled batch gets this long to settle
+_BATCH_MAX_WAIT = 25 * 3600.0
+_BATCH_CANCEL_GRACE = 600.0
+
+
+def _new_persona_id() -> str:
+    """Unique persona id; personas of one batch are created within the same second"""
+    return f"persona_{int(time.time())}_{uuid.uuid4().hex}"
+
+# Shared prompt prefix for profile content; the persona is appended after it
+_CONTENT_PREAMBLE = """You are creating professional LinkedIn content for the professional described in the PERSONA section at the end of this prompt.
+
+The content should be professional, authentic, and engaging for a French professional audience.
+IMPORTANT: Generate ALL content in FRENCH language only. Use proper French grammar, expressions, and professional terminology."""
+
+_CONTENT_INSTRUCTIONS = {
+    "headline": """Créez un titre LinkedIn convaincant (moins de 220 caractères) qui:
+- Met en valeur leur rôle actuel et leur expertise
+- Montre la proposition de valeur
+- Est engageant et professionnel
+- Utilise des mots-clés pertinents du secteur
+
+Rédigez UNIQUEMENT en français. Retournez seulement le texte du titre, sans guillemets ni formatage supplémentaire.""",
+    "summary": """Créez un résumé LinkedIn professionnel (300-500 mots) qui:
+- Raconte leur histoire professionnelle
+- Met en valeur les principales réalisations et compétences
+- Montre la personnalité tout en restant professionnel
+- Inclut un appel à l'action
+- Utilise la première personne
+
+Rédigez UNIQUEMENT en français. Retournez seulement le texte du résumé.""",
+    "about": """Créez une section "À propos" (200-300 mots) qui:
+- Fournit un aperçu professionnel
+- Met en valeur l'expertise et la passion
+- Montre ce qui les rend uniques
+- Inclut une invitation à prendre contact
+
+Rédigez UNIQUEMENT en français. Retournez seulement le texte de la section À propos.""",
+    "post": """Créez une publication LinkedIn engageante (100-200 mots) qui:
+- Partage une perspective ou expérience professionnelle
+- Apporte de la valeur à leur réseau
+- Encourage l'engagement
+- Reflète leur expertise
+- Utilise un ton conversationnel mais professionnel
+
+Rédigez UNIQUEMENT en français. Retournez seulement le texte de la publication, sans hashtags (ils seront générés séparément).""",
+}
+
+# Single-call variant: every profile text in one JSON object
+_ALL_CONTENT_INSTRUCTIONS = """Créez l'ensemble du contenu du profil LinkedIn en une seule réponse:
+- "headline": un titre convaincant (moins de 220 caractères) mettant en valeur le rôle actuel, l'expertise et la proposition de valeur
+- "summary": un résumé professionnel (300-500 mots) à la première personne, racontant le parcours, les réalisations et compétences clés, avec un appel à l'action
+- "about": une section "À propos" (200-300 mots) présentant l'expertise, la passion et ce qui rend la personne unique, avec une invitation à prendre contact
+- "posts": exactement 3 publications engageantes (100-200 mots chacune), au ton conversationnel mais professionnel, partageant une perspective ou expérience, sans hashtags
+
+Rédigez UNIQUEMENT en français. Retournez uniquement un objet JSON de la forme:
+{"headline": "...", "summary": "...", "about": "...", "posts": ["...", "...", "..."]}"""
+
+# Persona details appended after the static instructions of content prompts
+_PERSONA_BLOCK_TEMPLATE = """Role: {position} at {company} in the {industry} industry
+- Name: {first_name} {last_name}
+- Experience: {experience_years} years
+- Location: {location}
+- Key skills: {key_skills}"""
+
+_BACKGROUND_PROMPT_TEMPLATE = """
+        Generate a realistic professional background for a French professional:
+        
+        Name: {first_name} {last_name}
+        Age: {age}
+        Industry: {industry}
+        Experience Level: {experience_level}
+        Years of Experience: {experience_years}
+        Location: {location}
+        
+        IMPORTANT: Generate ALL content in FRENCH language only. Use French company names, French educational institutions, and French job titles.
+        
+        Return a JSON object with:
+        {{
+            "current_position": "Titre du poste en français",
+            "current_company": "Nom d'entreprise française",
+            "industry": "{industry}",
+            "experience_years": {experience_years},
+            "education": [
+                {{"degree": "Diplôme en français", "school": "École/Université française", "year": "Année"}}
+            ],
+            "previous_positions": [
+                {{"title": "Titre du poste en français", "company": "Entreprise française", "duration": "Durée en français"}}
+            ]
+        }}
+        
+        Make it realistic for the French market and industry with authentic French professional terminology.
+        """
+
+_SKILLS_PROMPT_TEMPLATE = """
+        Generate realistic skills and certifications for a {position} 
+        in {industry} with {experience_years} years of experience.
+        
+        IMPORTANT: Generate ALL skills and certifications in FRENCH language only.
+        
+        Return a JSON object with:
+        {{
+            "technical_skills": ["compétence technique 1", "compétence technique 2", "compétence technique 3", "compétence technique 4", "compétence technique 5"],
+            "soft_skills": ["compétence relationnelle 1", "compétence relationnelle 2", "compétence relationnelle 3", "compétence relationnelle 4"],
+            "certifications": ["certification française 1", "certification française 2", "certification française 3"],
+            "languages_spoken": [
+                {{"language": "Français", "level": "Langue maternelle"}},
+                {{"language": "Anglais", "level": "Professionnel"}}
+            ]
+        }}
+        
+        Make skills relevant to the French industry and experience level using French professional terminology.
+        """
+
+# Generated-content limits and the template markers the model sometimes leaves in
+_MIN_CONTENT_CHARS = 10
+_MAX_HEADLINE_CHARS = 220
+_MAX_SUMMARY_CHARS = 2000
+_PLACEHOLDER_RE = re.compile(r"\[(?:PLACEHOLDER|INSERT_NAME|INSERT_COMPANY)\]")
+
+# Name and city pools for demographic sampling
+_FRENCH_FIRST_NAMES = (
+    "Antoine", "Pierre", "Jean", "Louis", "Nicolas", "Alexandre", "François", "Julien", "Thomas", "Maxime",
+    "Marie", "Sophie", "Catherine", "Isabelle", "Nathalie", "Sylvie", "Céline", "Amélie", "Claire", "Émilie"
+)
+_FRENCH_LAST_NAMES = (
+    "Martin", "Bernard", "Dubois", "Thomas", "Robert", "Richard", "Petit", "Durand", "Leroy", "Moreau",
+    "Simon", "Laurent", "Lefebvre", "Michel", "Garcia", "David", "Bertrand", "Roux", "Vincent", "Fournier"
+)
+_FRENCH_CITIES = (
+    "Paris", "Lyon", "Marseille", "Toulouse", "Nice", "Nantes", "Strasbourg", "Montpellier", "Bordeaux", "Lille"
+)
+
 class IndustryType(Enum):
     TECHNOLOGY = "technology"
     FINANCE = "finance"
@@ -82,6 +411,32 @@ class PersonaProfile:
     persona_id: str
     created_at: datetime
 
+    @functools.cached_property
+    def experience_level(self) -> ExperienceLevel:
+        """Experience level implied by the persona's years of experience"""
+        years = self.professional_data.experience_years
+        if years <= 2:
+            return ExperienceLevel.ENTRY_LEVEL
+        elif years <= 7:
+            return ExperienceLevel.MID_LEVEL
+        elif years <= 15:
+            return ExperienceLevel.SENIOR_LEVEL
+        return ExperienceLevel.EXECUTIVE
+
+    @functools.cached_property
+    def prompt_context(self) -> str:
+        """Persona block shared by every content prompt for this persona"""
+        return _PERSONA_BLOCK_TEMPLATE.format(
+            position=self.professional_data.current_position,
+            company=self.professional_data.current_company,
+            industry=self.professional_data.industry,
+            first_name=self.demographic_data.first_name,
+            last_name=self.demographic_data.last_name,
+            experience_years=self.professional_data.experience_years,
+            location=self.demographic_data.location,
+            key_skills=', '.join(self.skills_data.technical_skills[:3])
+        )
+
 @dataclass
 class GeneratedContent:
     """Generated content result"""
@@ -105,13 +460,24 @@ class AIContentGenerator:
     """
 
     def __init__(self):
-        self.client = openai.OpenAI(
-            api_key=config.external_services.openai_api_key
-        )
+        self._api_key = config.external_services.openai_api_key
+        self._client: Optional[openai.AsyncOpenAI] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client_closer: Optional[AsyncGenerator[None, None]] = None
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._inflight: Dict[str, asyncio.Task] = {}
         self.model = "gpt-5"  # Use GPT-5 for enhanced quality
+        self.fast_model = _FAST_MODEL
+        self._params_cache: Dict[tuple, Dict[str, Any]] = {}
+        
+    def optimize_openai_parameters(self, content_type: str, experience_level: ExperienceLevel,
+                                   industry: Optional[str] = None) -> Dict[str, Any]:
+        """Optimize OpenAI parameters based on content type and experience (cached, treat as read-only)"""
+        cache_key = (content_type, experience_level, industry)
+        cached = self._params_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
-    def optimize_openai_parameters(self, content_type: str, experience_level: ExperienceLevel) -> Dict[str, Any]:
-        """Optimize OpenAI parameters based on content type and experience"""
         base_params = {
             "model": self.model,
             "temperature": 0.7,
@@ -146,20 +512,141 @@ class AIContentGenerator:
             base_params["temperature"] = max(0.5, base_params["temperature"] - 0.1)
         elif experience_level == ExperienceLevel.ENTRY_LEVEL:
             base_params["temperature"] = min(0.9, base_params["temperature"] + 0.1)
+
+        # Route requests sharing an instruction prefix to the same prompt-cache shard
+        base_params["prompt_cache_key"] = _prompt_cache_key(content_type, industry, experience_level)
         
+        self._params_cache[cache_key] = base_params
         return base_params
 
-    async def generate_with_retry(self, prompt: str, params: Dict[str, Any], max_retries: int = 3) -> str:
-        """Generate content with retry logic"""
+    async def _get_client(self) -> openai.AsyncOpenAI:
+        """Get the async OpenAI client for the running event loop."""
+        # The client's connection pool is bound to the loop that created it, and
+        # the sync wrappers run each call under a fresh asyncio.run loop
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            if self._client is not None:
+                await self._release_client()
+            client = openai.AsyncOpenAI(
+                api_key=self._api_key,
+                timeout=60,
+                http_client=openai.DefaultAsyncHttpxClient(
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+                )
+            )
+            # Close the pool when the loop shuts down its async generators
+            closer = self._close_at_loop_shutdown(client)
+            await closer.asend(None)
+            self._client = client
+            self._client_closer = closer
+            self._client_loop = loop
+            self._sem = asyncio.Semaphore(_OPENAI_MAX_CONCURRENCY)
+            # In-flight tasks belong to the previous loop and can't be awaited here
+            self._inflight = {}
+        return self._client
+
+    async def _close_at_loop_shutdown(self, client: openai.AsyncOpenAI) -> AsyncGenerator[None, None]:
+        """Hold a loop's client open until the generator is closed."""
+        try:
+            yield
+        finally:
+            if self._client is client:
+                self._client = None
+                self._client_closer = None
+                self._client_loop = None
+            await client.close()
+
+    async def _release_client(self):
+        """Close the client of a previous event loop."""
+        client, closer, loop = self._client, self._client_closer, self._client_loop
+        self._client = None
+        self._client_closer = None
+        self._client_loop = None
+        if loop is not None and loop.is_running():
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(closer.aclose(), loop))
+            return
+        # The owning loop stopped without finalizing its generators, so close
+        # the pool from here as best we can
+        try:
+            await client.close()
+        except Exception as e:
+            logger.warning(f"Failed to close OpenAI client of a stopped loop: {e}")
+
+    async def aclose(self):
+        """Close the OpenAI client's connection pool."""
+        if self._client is not None and self._client_loop is asyncio.get_running_loop():
+            await self._client_closer.aclose()
+        elif self._client is not None:
+            await self._release_client()
+
+    async def generate_with_retry(self, prompt: str, params: Dict[str, Any], max_retries: int = 3,
+                                  cache: bool = False, coalesce: Optional[bool] = None) -> str:
+        """Generate content with retry logic
+
+        cache serves identical requests from the response cache; it is opt-in
+        because generated personas must not repeat each other. coalesce
+        (default: same as cache) lets concurrent identical requests share one
+        API call; leave it off where callers want distinct samples.
+        """
+        if coalesce is None:
+            coalesce = cache
+        if not cache and not coalesce:
+            return await self._generate_uncached(prompt, params, max_retries)
+
+        key = hashlib.sha256(
+            json.dumps({"prompt": prompt, **params}, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        if cache:
+            cached = _response_cache.get(key)
+            if cached is None and config.cache.ai_response_cache_path:
+                cached = await asyncio.to_thread(_persistent_get, key)
+                if cached is not None:
+                    _response_cache.set(key, cached)
+            if cached is not None:
+                logger.info("Content served from response cache")
+                return cached
+
+        if coalesce:
+            # Collapse identical in-flight requests onto a single API call; the
+            # client lookup resets the table when the event loop has changed
+            await self._get_client()
+            inflight = self._inflight
+            task = inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(self._generate_uncached(prompt, params, max_retries))
+                inflight[key] = task
+                task.add_done_callback(lambda _: inflight.pop(key, None))
+            content = await asyncio.shield(task)
+        else:
+            content = await self._generate_uncached(prompt, params, max_retries)
+        if cache:
+            _response_cache.set(key, content)
+            if config.cache.ai_response_cache_path:
+                await asyncio.to_thread(_persistent_set, key, content)
+        return content
+
+    async def _generate_uncached(self, prompt: str, params: Dict[str, Any], max_retries: int) -> str:
+        """Call the API with retry logic"""
         for attempt in range(max_retries):
             try:
-                response = await asyncio.to_thread(
-                    self.client.chat.completions.create,
-                    messages=[{"role": "user", "content": prompt}],
-                    **params
-                )
+                client = await self._get_client()
+                async with self._sem:
+                    await _rate_limiter.acquire(params.get("max_tokens", 0) + len(prompt) // 4)
+                    # Stream so the read timeout applies per chunk rather than to
+                    # the whole completion, and the connection frees up sooner
+                    stream = await client.chat.completions.create(
+                        messages=[{"role": "user", "content": prompt}],
+                        stream=True,
+                        **params
+                    )
+                    parts = []
+                    async for chunk in stream:
+                        if chunk.choices and chunk.choices[0].delta.content:
+                            parts.append(chunk.choices[0].delta.content)
                 
-                content = response.choices[0].message.content.strip()
+                content = "".join(parts).strip()
+                if not content:
+                    raise ValueError("Empty completion")
                 logger.info(f"Content generated successfully (attempt {attempt + 1})")
                 return content
                 
@@ -167,28 +654,98 @@ class AIContentGenerator:
                 logger.warning(f"Content generation attempt {attempt + 1} failed: {e}")
                 if attempt == max_retries - 1:
                     raise e
-                await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                # Honour the server's Retry-After on 429s, else exponential backoff
+                delay = _retry_after(e)
+                await asyncio.sleep(delay if delay is not None else 2 ** attempt)
         
         raise Exception("Failed to generate content after all retries")
 
+    async def run_batch(self, requests: Dict[str, tuple], poll_interval: float = _BATCH_POLL_INTERVAL,
+                        max_wait: float = _BATCH_MAX_WAIT) -> Dict[str, str]:
+        """Run (prompt, params) chat completions through the Batch API, keyed by custom_id
+
+        Returns the completion text for every request that succeeded; failed or
+        expired requests are simply missing from the result. A batch still
+        running after max_wait seconds is cancelled.
+        """
+        lines = []
+        for custom_id, (prompt, params) in requests.items():
+            # timeout is a client option, not part of the request body
+            body = {key: value for key, value in params.items() if key != "timeout"}
+            body["messages"] = [{"role": "user", "content": prompt}]
+            lines.append(jsonutil.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body
+            }))
+
+        client = await self._get_client()
+        batch_file = await client.files.create(
+            file=("requests.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=_BATCH_COMPLETION_WINDOW
+        )
+        logger.info(f"Submitted batch {batch.id} with {len(lines)} requests")
+
+        deadline = time.monotonic() + max_wait
+        cancelled = False
+        while batch.status not in _BATCH_TERMINAL_STATUSES:
+            if time.monotonic() >= deadline:
+                if cancelled:
+                    raise TimeoutError(f"Batch {batch.id} still {batch.status} after cancellation")
+                logger.warning(f"Batch {batch.id} still {batch.status} after {max_wait:.0f}s, cancelling")
+                batch = await client.batches.cancel(batch.id)
+                cancelled = True
+                deadline = time.monotonic() + _BATCH_CANCEL_GRACE
+                continue
+            await asyncio.sleep(poll_interval)
+            batch = await client.batches.retrieve(batch.id)
+
+        logger.info(f"Batch {batch.id} finished with status {batch.status}")
+        # Expired and cancelled batches still carry an output file for the requests that completed
+        if not batch.output_file_id:
+            raise Exception(f"Batch {batch.id} {batch.status} without output")
+
+        output = await client.files.content(batch.output_file_id)
+        results = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = jsonutil.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                logger.warning(f"Batch request {record.get('custom_id')} failed: {record.get('error') or response.get('body')}")
+                continue
+            results[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"].strip()
+        return results
+
     async def validate_and_optimize_content(self, content: str, content_type: str, persona: PersonaProfile) -> str:
         """Validate and optimize generated content"""
         # Basic validation
-        if not content or len(content.strip()) < 10:
+        if not content or len(content.strip()) < _MIN_CONTENT_CHARS:
             raise ValueError("Generated content is too short")
         
         # Content-specific validation
-        if content_type == "headline" and len(content) > 220:
+        if content_type == "headline" and len(content) > _MAX_HEADLINE_CHARS:
             # Truncate headline if too long
-            content = content[:217] + "..."
-        elif content_type == "summary" and len(content) > 2000:
+            content = content[:_MAX_HEADLINE_CHARS - 3] + "..."
+        elif content_type == "summary" and len(content) > _MAX_SUMMARY_CHARS:
             # Truncate summary if too long
-            content = content[:1997] + "..."
+            content = content[:_MAX_SUMMARY_CHARS - 3] + "..."
         
-        # Remove any inappropriate content markers
-        content = content.replace("[PLACEHOLDER]", "")
-        content = content.replace("[INSERT_NAME]", persona.demographic_data.first_name)
-        content = content.replace("[INSERT_COMPANY]", persona.professional_data.current_company)
+        # Remove any inappropriate content markers in a single pass
+        if "[" in content:
+            replacements = {
+                "[PLACEHOLDER]": "",
+                "[INSERT_NAME]": persona.demographic_data.first_name,
+                "[INSERT_COMPANY]": persona.professional_data.current_company
+            }
+            content = _PLACEHOLDER_RE.sub(lambda match: replacements[match.group(0)], content)
         
         return content.strip()
 
@@ -208,8 +765,9 @@ class AIContentGenerator:
             try:
                 hashtags_response = await self.generate_with_retry(
                     hashtag_prompt,
-                    {"model": self.model, "temperature": 0.5, "max_tokens": 100},
-                    max_retries=2
+                    {"model": self.fast_model, "temperature": 0.5, "max_tokens": 100},
+                    max_retries=2,
+                    cache=True
                 )
                 
                 hashtags = [line.strip() for line in hashtags_response.split('\n') if line.strip().startswith('#')]
@@ -227,22 +785,12 @@ class AIContentGenerator:
         try:
             # Generate content prompt based on type
             prompt = self.create_content_prompt(content_type, persona)
-            
-            # Map experience years to ExperienceLevel enum
-            years = persona.professional_data.experience_years
-            if years <= 2:
-                experience_level = ExperienceLevel.ENTRY_LEVEL
-            elif years <= 7:
-                experience_level = ExperienceLevel.MID_LEVEL
-            elif years <= 15:
-                experience_level = ExperienceLevel.SENIOR_LEVEL
-            else:
-                experience_level = ExperienceLevel.EXECUTIVE
 
             # Optimize OpenAI parameters
             openai_params = self.optimize_openai_parameters(
                 content_type=content_type,
-                experience_level=experience_level
+                experience_level=persona.experience_level,
+                industry=persona.professional_data.industry
             )
 
             # Generate content with retry logic
@@ -284,78 +832,57 @@ class AIContentGenerator:
                 error_message=str(e)
             )
 
+    async def generate_all_content(self, persona: PersonaProfile) -> Dict[str, Any]:
+        """Generate headline, summary, about and 3 posts in a single JSON-mode call"""
+        response = await self.generate_with_retry(
+            prompt=self.create_all_content_prompt(persona),
+            params=self.all_content_params(persona),
+            max_retries=2
+        )
+        return await self.parse_all_content(response, persona)
+
+    def all_content_params(self, persona: PersonaProfile) -> Dict[str, Any]:
+        """OpenAI parameters for the combined content call"""
+        return {
+            "model": self.model,
+            "temperature": 0.7,
+            "max_tokens": 3500,
+            "top_p": 0.9,
+            "frequency_penalty": 0.1,
+            "presence_penalty": 0.1,
+            "response_format": _JSON_OBJECT_FORMAT,
+            "prompt_cache_key": _prompt_cache_key("all", persona.professional_data.industry, persona.experience_level)
+        }
+
+    def create_all_content_prompt(self, persona: PersonaProfile) -> str:
+        """Create the combined content prompt for persona"""
+        return f"{_CONTENT_PREAMBLE}\n\n{_ALL_CONTENT_INSTRUCTIONS}\n\n---\nPERSONA:\n{persona.prompt_context}\n"
+
+    async def parse_all_content(self, response: str, persona: PersonaProfile) -> Dict[str, Any]:
+        """Parse and validate a combined content response"""
+        data = jsonutil.loads(response)
+        posts = data.get("posts")
+        if not isinstance(posts, list):
+            raise ValueError("Combined content response has no posts list")
+        return {
+            "headline": await self.validate_and_optimize_content(data["headline"], "headline", persona),
+            "summary": await self.validate_and_optimize_content(data["summary"], "summary", persona),
+            "about": await self.validate_and_optimize_content(data["about"], "about", persona),
+            "posts": [
+                await self.validate_and_optimize_content(post, "post", persona)
+                for post in posts[:3]
+            ]
+        }
+
     def create_content_prompt(self, content_type: str, persona: PersonaProfile) -> str:
         """Create content generation prompt based on type and persona"""
-        base_context = f"""
-        You are creating professional LinkedIn content for a {persona.professional_data.current_position} 
-        at {persona.professional_data.current_company} in the {persona.professional_data.industry} industry.
-        
-        Profile details:
-        - Name: {persona.demographic_data.first_name} {persona.demographic_data.last_name}
-        - Experience: {persona.professional_data.experience_years} years
-        - Location: {persona.demographic_data.location}
-        - Key skills: {', '.join(persona.skills_data.technical_skills[:3])}
-        
-        The content should be professional, authentic, and engaging for a French professional audience.
-        IMPORTANT: Generate ALL content in FRENCH language only. Use proper French grammar, expressions, and professional terminology.
-        """
-        
-        if content_type == "headline":
-            return f"""
-            {base_context}
-            
-            Créez un titre LinkedIn convaincant (moins de 220 caractères) qui:
-            - Met en valeur leur rôle actuel et leur expertise
-            - Montre la proposition de valeur
-            - Est engageant et professionnel
-            - Utilise des mots-clés pertinents du secteur
-            
-            Rédigez UNIQUEMENT en français. Retournez seulement le texte du titre, sans guillemets ni formatage supplémentaire.
-            """
-            
-        elif content_type == "summary":
-            return f"""
-            {base_context}
-            
-            Créez un résumé LinkedIn professionnel (300-500 mots) qui:
-            - Raconte leur histoire professionnelle
-            - Met en valeur les principales réalisations et compétences
-            - Montre la personnalité tout en restant professionnel
-            - Inclut un appel à l'action
-            - Utilise la première personne
-            
-            Rédigez UNIQUEMENT en français. Retournez seulement le texte du résumé.
-            """
-            
-        elif content_type == "about":
-            return f"""
-            {base_context}
-            
-            Créez une section "À propos" (200-300 mots) qui:
-            - Fournit un aperçu professionnel
-            - Met en valeur l'expertise et la passion
-            - Montre ce qui les rend uniques
-            - Inclut une invitation à prendre contact
-            
-            Rédigez UNIQUEMENT en français. Retournez seulement le texte de la section À propos.
-            """
-            
-        elif content_type == "post":
-            return f"""
-            {base_context}
-            
-            Créez une publication LinkedIn engageante (100-200 mots) qui:
-            - Partage une perspective ou expérience professionnelle
-            - Apporte de la valeur à leur réseau
-            - Encourage l'engagement
-            - Reflète leur expertise
-            - Utilise un ton conversationnel mais professionnel
-            
-            Rédigez UNIQUEMENT en français. Retournez seulement le texte de la publication, sans hashtags (ils seront générés séparément).
-            """
-        
-        else:
-            return f"{base_context}\n\nCréez du contenu professionnel de type {content_type} en français uniquement."
+        # Static instructions go first and persona details last, so requests of
+        # the same content type share the longest possible prompt prefix
+        instructions = _CONTENT_INSTRUCTIONS.get(
+            content_type,
+            f"Créez du contenu professionnel de type {content_type} en français uniquement."
+        )
+        return f"{_CONTENT_PREAMBLE}\n\n{instructions}\n\n---\nPERSONA:\n{persona.prompt_context}\n"
 
 
 class PersonaGenerator:
@@ -372,172 +899,171 @@ class PersonaGenerator:
     7. Validate persona completeness and realism
     """
 
+    _BACKGROUND_PARAMS = {"model": _FAST_MODEL, "temperature": 0.3, "max_tokens": 800, "timeout": 60,
+                          "response_format": _JSON_OBJECT_FORMAT}
+    _SKILLS_PARAMS = {"model": _FAST_MODEL, "temperature": 0.2, "max_tokens": 500, "timeout": 60,
+                      "response_format": _JSON_OBJECT_FORMAT}
+
     def __init__(self):
         self.content_generator = AIContentGenerator()
-        self.french_first_names = [
-            "Antoine", "Pierre", "Jean", "Louis", "Nicolas", "Alexandre", "François", "Julien", "Thomas", "Maxime",
-            "Marie", "Sophie", "Catherine", "Isabelle", "Nathalie", "Sylvie", "Céline", "Amélie", "Claire", "Émilie"
-        ]
-        self.french_last_names = [
-            "Martin", "Bernard", "Dubois", "Thomas", "Robert", "Richard", "Petit", "Durand", "Leroy", "Moreau",
-            "Simon", "Laurent", "Lefebvre", "Michel", "Garcia", "David", "Bertrand", "Roux", "Vincent", "Fournier"
-        ]
-        self.french_cities = [
-            "Paris", "Lyon", "Marseille", "Toulouse", "Nice", "Nantes", "Strasbourg", "Montpellier", "Bordeaux", "Lille"
-        ]
 
-    async def generate_demographic_data(self, industry: IndustryType, experience_level: ExperienceLevel) -> DemographicData:
+    # Age range by experience level
+    _AGE_RANGES = {
+        ExperienceLevel.ENTRY_LEVEL: (22, 28),
+        ExperienceLevel.MID_LEVEL: (28, 38),
+        ExperienceLevel.SENIOR_LEVEL: (35, 50),
+        ExperienceLevel.EXECUTIVE: (40, 60)
+    }
+
+    def generate_demographic_data(self, industry: IndustryType, experience_level: ExperienceLevel) -> DemographicData:
         """Generate realistic demographic data"""
-        first_name = random.choice(self.french_first_names)
-        last_name = random.choice(self.french_last_names)
-        
-        # Age based on experience level
-        age_ranges = {
-            ExperienceLevel.ENTRY_LEVEL: (22, 28),
-            ExperienceLevel.MID_LEVEL: (28, 38),
-            ExperienceLevel.SENIOR_LEVEL: (35, 50),
-            ExperienceLevel.EXECUTIVE: (40, 60)
-        }
-        
-        min_age, max_age = age_ranges[experience_level]
-        age = random.randint(min_age, max_age)
-        
-        location = f"{random.choice(self.french_cities)}, France"
-        
-        return DemographicData(
-            first_name=first_name,
-            last_name=last_name,
-            age=age,
-            location=location,
-            nationality="French",
-            languages=["French", "English"]
-        )
+        return self.generate_demographic_data_batch(1, experience_level)[0]
+
+    def generate_demographic_data_batch(self, n: int, experience_level: ExperienceLevel) -> List[DemographicData]:
+        """Generate demographic data for n personas of one experience level"""
+        min_age, max_age = self._AGE_RANGES[experience_level]
+        return [
+            DemographicData(
+                first_name=first_name,
+                last_name=last_name,
+                age=random.randint(min_age, max_age),
+                location=f"{city}, France",
+                nationality="French",
+                languages=["French", "English"]
+            )
+            for first_name, last_name, city in zip(
+                random.choices(_FRENCH_FIRST_NAMES, k=n),
+                random.choices(_FRENCH_LAST_NAMES, k=n),
+                random.choices(_FRENCH_CITIES, k=n)
+            )
+        ]
 
     async def generate_professional_background(self, demographic_data: DemographicData, 
                                              industry: IndustryType, 
                                              experience_level: ExperienceLevel) -> ProfessionalData:
         """Generate professional background using AI"""
         
-        experience_years = {
-            ExperienceLevel.ENTRY_LEVEL: random.randint(0, 3),
-            ExperienceLevel.MID_LEVEL: random.randint(3, 8),
-            ExperienceLevel.SENIOR_LEVEL: random.randint(8, 15),
-            ExperienceLevel.EXECUTIVE: random.randint(15, 25)
-        }[experience_level]
-        
-        prompt = f"""
-        Generate a realistic professional background for a French professional:
-        
-        Name: {demographic_data.first_name} {demographic_data.last_name}
-        Age: {demographic_data.age}
-        Industry: {industry.value}
-        Experience Level: {experience_level.value}
-        Years of Experience: {experience_years}
-        Location: {demographic_data.location}
-        
-        IMPORTANT: Generate ALL content in FRENCH language only. Use French company names, French educational institutions, and French job titles.
-        
-        Return a JSON object with:
-        {{
-            "current_position": "Titre du poste en français",
-            "current_company": "Nom d'entreprise française",
-            "industry": "{industry.value}",
-            "experience_years": {experience_years},
-            "education": [
-                {{"degree": "Diplôme en français", "school": "École/Université française", "year": "Année"}}
-            ],
-            "previous_positions": [
-                {{"title": "Titre du poste en français", "company": "Entreprise française", "duration": "Durée en français"}}
-            ]
-        }}
-        
-        Make it realistic for the French market and industry with authentic French professional terminology.
-        """
+        experience_years = self._random_experience_years(experience_level)
+        prompt = self.create_background_prompt(demographic_data, industry, experience_level, experience_years)
         
         try:
             response = await self.content_generator.generate_with_retry(
                 prompt,
-                {"model": "gpt-5", "temperature": 0.3, "max_tokens": 800, "timeout": 60},
+                self._step_params(self._BACKGROUND_PARAMS, "bg", industry, experience_level),
                 max_retries=3
             )
-            
-            # Parse JSON response
-            data = json.loads(response)
-            
-            return ProfessionalData(
-                current_position=data["current_position"],
-                current_company=data["current_company"],
-                industry=data["industry"],
-                experience_years=data["experience_years"],
-                education=data["education"],
-                previous_positions=data["previous_positions"]
-            )
+            return self.parse_professional_background(response)
             
         except Exception as e:
             logger.error(f"Error generating professional background: {e}")
-            # Fallback data in French
-            return ProfessionalData(
-                current_position=f"Spécialiste {industry.value.title()} {experience_level.value.replace('_', ' ').title()}",
-                current_company="TechCorp France",
-                industry=industry.value,
-                experience_years=experience_years,
-                education=[{"degree": "Master en Informatique", "school": "Université de Paris", "year": "2015"}],
-                previous_positions=[{"title": "Analyste Junior", "company": "StartupCo France", "duration": "2 ans"}]
-            )
+            return self.fallback_professional_background(industry, experience_level, experience_years)
+
+    @staticmethod
+    def _step_params(base: Dict[str, Any], step: str, industry: IndustryType,
+                     experience_level: ExperienceLevel) -> Dict[str, Any]:
+        """Parameters for a structured step, pinned to a prompt-cache shard"""
+        return {**base, "prompt_cache_key": _prompt_cache_key(step, industry.value, experience_level)}
+
+    @staticmethod
+    def _random_experience_years(experience_level: ExperienceLevel) -> int:
+        """Pick a years-of-experience figure for the experience level"""
+        return {
+            ExperienceLevel.ENTRY_LEVEL: random.randint(0, 3),
+            ExperienceLevel.MID_LEVEL: random.randint(3, 8),
+            ExperienceLevel.SENIOR_LEVEL: random.randint(8, 15),
+            ExperienceLevel.EXECUTIVE: random.randint(15, 25)
+        }[experience_level]
+
+    def create_background_prompt(self, demographic_data: DemographicData, industry: IndustryType,
+                                 experience_level: ExperienceLevel, experience_years: int) -> str:
+        """Create the professional background prompt"""
+        return _BACKGROUND_PROMPT_TEMPLATE.format(
+            first_name=demographic_data.first_name,
+            last_name=demographic_data.last_name,
+            age=demographic_data.age,
+            industry=industry.value,
+            experience_level=experience_level.value,
+            experience_years=experience_years,
+            location=demographic_data.location
+        )
+
+    @staticmethod
+    def parse_professional_background(response: str) -> ProfessionalData:
+        """Parse a professional background JSON response"""
+        data = jsonutil.loads(response)
+        return ProfessionalData(
+            current_position=data["current_position"],
+            current_company=data["current_company"],
+            industry=data["industry"],
+            experience_years=data["experience_years"],
+            education=data["education"],
+            previous_positions=data["previous_positions"]
+        )
+
+    @staticmethod
+    def fallback_professional_background(industry: IndustryType, experience_level: ExperienceLevel,
+                                         experience_years: int) -> ProfessionalData:
+        """Fallback professional background in French"""
+        return ProfessionalData(
+            current_position=f"Spécialiste {industry.value.title()} {experience_level.value.replace('_', ' ').title()}",
+            current_company="TechCorp France",
+            industry=industry.value,
+            experience_years=experience_years,
+            education=[{"degree": "Master en Informatique", "school": "Université de Paris", "year": "2015"}],
+            previous_positions=[{"title": "Analyste Junior", "company": "StartupCo France", "duration": "2 ans"}]
+        )
 
     async def generate_skills_and_certifications(self, professional_data: ProfessionalData,
                                                industry: IndustryType,
                                                experience_level: ExperienceLevel) -> SkillsData:
         """Generate skills and certifications"""
         
-        prompt = f"""
-        Generate realistic skills and certifications for a {professional_data.current_position} 
-        in {industry.value} with {professional_data.experience_years} years of experience.
-        
-        IMPORTANT: Generate ALL skills and certifications in FRENCH language only.
-        
-        Return a JSON object with:
-        {{
-            "technical_skills": ["compétence technique 1", "compétence technique 2", "compétence technique 3", "compétence technique 4", "compétence technique 5"],
-            "soft_skills": ["compétence relationnelle 1", "compétence relationnelle 2", "compétence relationnelle 3", "compétence relationnelle 4"],
-            "certifications": ["certification française 1", "certification française 2", "certification française 3"],
-            "languages_spoken": [
-                {{"language": "Français", "level": "Langue maternelle"}},
-                {{"language": "Anglais", "level": "Professionnel"}}
-            ]
-        }}
-        
-        Make skills relevant to the French industry and experience level using French professional terminology.
-        """
+        prompt = self.create_skills_prompt(professional_data, industry)
         
         try:
             response = await self.content_generator.generate_with_retry(
                 prompt,
-                {"model": "gpt-5", "temperature": 0.2, "max_tokens": 500, "timeout": 60},
+                self._step_params(self._SKILLS_PARAMS, "skills", industry, experience_level),
                 max_retries=3
             )
-            
-            data = json.loads(response)
-            
-            return SkillsData(
-                technical_skills=data["technical_skills"],
-                soft_skills=data["soft_skills"],
-                certifications=data["certifications"],
-                languages_spoken=data["languages_spoken"]
-            )
+            return self.parse_skills(response)
             
         except Exception as e:
             logger.error(f"Error generating skills: {e}")
-            # Fallback skills in French
-            return SkillsData(
-                technical_skills=["Python", "Analyse de données", "Gestion de projet", "SQL", "Excel"],
-                soft_skills=["Leadership", "Communication", "Résolution de problèmes", "Travail d'équipe"],
-                certifications=["PMP", "Certification Agile"],
-                languages_spoken=[
-                    {"language": "Français", "level": "Langue maternelle"},
-                    {"language": "Anglais", "level": "Professionnel"}
-                ]
-            )
+            return self.fallback_skills()
+
+    @staticmethod
+    def create_skills_prompt(professional_data: ProfessionalData, industry: IndustryType) -> str:
+        """Create the skills and certifications prompt"""
+        return _SKILLS_PROMPT_TEMPLATE.format(
+            position=professional_data.current_position,
+            industry=industry.value,
+            experience_years=professional_data.experience_years
+        )
+
+    @staticmethod
+    def parse_skills(response: str) -> SkillsData:
+        """Parse a skills and certifications JSON response"""
+        data = jsonutil.loads(response)
+        return SkillsData(
+            technical_skills=data["technical_skills"],
+            soft_skills=data["soft_skills"],
+            certifications=data["certifications"],
+            languages_spoken=data["languages_spoken"]
+        )
+
+    @staticmethod
+    def fallback_skills() -> SkillsData:
+        """Fallback skills in French"""
+        return SkillsData(
+            technical_skills=["Python", "Analyse de données", "Gestion de projet", "SQL", "Excel"],
+            soft_skills=["Leadership", "Communication", "Résolution de problèmes", "Travail d'équipe"],
+            certifications=["PMP", "Certification Agile"],
+            languages_spoken=[
+                {"language": "Français", "level": "Langue maternelle"},
+                {"language": "Anglais", "level": "Professionnel"}
+            ]
+        )
 
     async def generate_professional_content(self, demographic_data: DemographicData,
                                           professional_data: ProfessionalData,
@@ -555,17 +1081,26 @@ class PersonaGenerator:
             created_at=datetime.now()
         )
         
-        # Generate different types of content
-        headline_result = await self.content_generator.generate_professional_content("headline", temp_persona)
-        summary_result = await self.content_generator.generate_professional_content("summary", temp_persona)
-        about_result = await self.content_generator.generate_professional_content("about", temp_persona)
-        
-        # Generate sample posts
-        sample_posts = []
-        for i in range(3):
-            post_result = await self.content_generator.generate_professional_content("post", temp_persona)
-            if post_result.success:
-                sample_posts.append(post_result.content)
+        # One JSON-mode call covers every text; fall back to per-type calls if
+        # the combined response is unusable
+        try:
+            content = await self.content_generator.generate_all_content(temp_persona)
+            return ContentData(
+                headline=content["headline"],
+                summary=content["summary"],
+                about_section=content["about"],
+                sample_posts=content["posts"]
+            )
+        except Exception as e:
+            logger.warning(f"Combined content generation failed, falling back to per-type calls: {e}")
+
+        # Generate headline, summary, about and 3 sample posts concurrently; the
+        # calls are independent and generate_professional_content never raises
+        headline_result, summary_result, about_result, *post_results = await asyncio.gather(*(
+            self.content_generator.generate_professional_content(content_type, temp_persona)
+            for content_type in ("headline", "summary", "about", "post", "post", "post")
+        ))
+        sample_posts = [post_result.content for post_result in post_results if post_result.success]
         
         return ContentData(
             headline=headline_result.content if headline_result.success else f"{professional_data.current_position} chez {professional_data.current_company}",
@@ -587,11 +1122,11 @@ class PersonaGenerator:
     async def generate_professional_persona(self, industry: IndustryType, experience_level: ExperienceLevel) -> PersonaProfile:
         """AI-powered persona generation algorithm"""
         
-        persona_id = f"persona_{int(datetime.now().timestamp())}_{random.randint(1000, 9999)}"
+        persona_id = _new_persona_id()
         
         try:
             # Step 1: Generate basic demographic data
-            demographic_data = await self.generate_demographic_data(
+            demographic_data = self.generate_demographic_data(
                 industry=industry,
                 experience_level=experience_level
             )
@@ -610,17 +1145,17 @@ class PersonaGenerator:
                 experience_level=experience_level
             )
 
-            # Step 4: Generate content (headline, summary, posts)
-            content_data = await self.generate_professional_content(
-                demographic_data=demographic_data,
-                professional_data=professional_data,
-                skills_data=skills_data
-            )
-
-            # Step 5: Generate visual assets
-            visual_assets = await self.generate_visual_assets(
-                demographic_data=demographic_data,
-                professional_data=professional_data
+            # Steps 4-5: Generate content (headline, summary, posts) and visual assets
+            content_data, visual_assets = await asyncio.gather(
+                self.generate_professional_content(
+                    demographic_data=demographic_data,
+                    professional_data=professional_data,
+                    skills_data=skills_data
+                ),
+                self.generate_visual_assets(
+                    demographic_data=demographic_data,
+                    professional_data=professional_data
+                )
             )
 
             persona = PersonaProfile(
@@ -640,24 +1175,169 @@ class PersonaGenerator:
             logger.error(f"Error generating persona: {e}")
             raise e
 
-# Synchronous wrappers for easier integration
+    async def generate_many(self, specs: List[tuple], use_batch_api: bool = True) -> List[PersonaProfile]:
+        """Generate personas for (industry, experience_level) specs, in order
+
+        With use_batch_api the background, skills and content stages each run as
+        one Batch API job (cheaper, but may take hours); otherwise personas are
+        generated concurrently in real time.
+        """
+        if not use_batch_api:
+            return list(await asyncio.gather(*(
+                self.generate_professional_persona(industry, experience_level)
+                for industry, experience_level in specs
+            )))
+
+        generator = self.content_generator
+        # Sample demographics in one pass per experience level
+        demographics: List[Optional[DemographicData]] = [None] * len(specs)
+        indices_by_level: Dict[ExperienceLevel, List[int]] = {}
+        for idx, (_, level) in enumerate(specs):
+            indices_by_level.setdefault(level, []).append(idx)
+        for level, indices in indices_by_level.items():
+            for idx, demographic_data in zip(indices, self.generate_demographic_data_batch(len(indices), level)):
+                demographics[idx] = demographic_data
+        years = [self._random_experience_years(level) for _, level in specs]
+
+        # Stage 1: professional backgrounds
+        results = await generator.run_batch({
+            f"{idx}:background": (
+                self.create_background_prompt(demographics[idx], industry, level, years[idx]),
+                self._step_params(self._BACKGROUND_PARAMS, "bg", industry, level)
+            )
+            for idx, (industry, level) in enumerate(specs)
+        })
+        backgrounds = []
+        for idx, (industry, level) in enumerate(specs):
+            try:
+                backgrounds.append(self.parse_professional_background(results[f"{idx}:background"]))
+            except Exception as e:
+                logger.error(f"Error generating professional background for persona {idx}: {e}")
+                backgrounds.append(self.fallback_professional_background(industry, level, years[idx]))
+
+        # Stage 2: skills and certifications
+        results = await generator.run_batch({
+            f"{idx}:skills": (
+                self.create_skills_prompt(backgrounds[idx], industry),
+                self._step_params(self._SKILLS_PARAMS, "skills", industry, level)
+            )
+            for idx, (industry, level) in enumerate(specs)
+        })
+        skills = []
+        for idx in range(len(specs)):
+            try:
+                skills.append(self.parse_skills(results[f"{idx}:skills"]))
+            except Exception as e:
+                logger.error(f"Error generating skills for persona {idx}: {e}")
+                skills.append(self.fallback_skills())
+
+        # Stage 3: combined profile content
+        visual_assets = await asyncio.gather(*(
+            self.generate_visual_assets(demographics[idx], backgrounds[idx])
+            for idx in range(len(specs))
+        ))
+        personas = [
+            PersonaProfile(
+                demographic_data=demographics[idx],
+                professional_data=backgrounds[idx],
+                skills_data=skills[idx],
+                content_data=None,
+                visual_assets=visual_assets[idx],
+                persona_id=_new_persona_id(),
+                created_at=datetime.now()
+            )
+            for idx in range(len(specs))
+        ]
+        results = await generator.run_batch({
+            f"{idx}:content": (generator.create_all_content_prompt(persona), generator.all_content_params(persona))
+            for idx, persona in enumerate(personas)
+        })
+        for idx, persona in enumerate(personas):
+            try:
+                content = await generator.parse_all_content(results[f"{idx}:content"], persona)
+                persona.content_data = ContentData(
+                    headline=content["headline"],
+                    summary=content["summary"],
+                    about_section=content["about"],
+                    sample_posts=content["posts"]
+                )
+            except Exception as e:
+                # Fill the gaps with real-time calls rather than failing the whole batch
+                logger.warning(f"Batch content for persona {idx} unusable, generating in real time: {e}")
+                persona.content_data = await self.generate_professional_content(
+                    persona.demographic_data, persona.professional_data, persona.skills_data
+                )
+
+        logger.info(f"Generated {len(personas)} personas via the Batch API")
+        return personas
+
+# Synchronous wrappers for easier integration. They run coroutines on one
+# long-lived background event loop, so the OpenAI client and its keep-alive
+# connections survive across calls instead of being rebuilt by asyncio.run.
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def _run_sync(coro):
+    """Run coro on the shared background event loop and wait for its result"""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            _background_loop = asyncio.new_event_loop()
+            threading.Thread(target=_background_loop.run_forever, name="ai-content-loop", daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coro, _background_loop).result()
+
+
+def _close_generator(content_generator: AIContentGenerator):
+    """Schedule an OpenAI client close on the background loop without waiting"""
+    if _background_loop is not None and not _background_loop.is_closed():
+        asyncio.run_coroutine_threadsafe(content_generator.aclose(), _background_loop)
+
+
 class PersonaGeneratorSync:
     """Synchronous wrapper for PersonaGenerator"""
     
     def __init__(self):
         self.generator = PersonaGenerator()
+        self._finalizer = weakref.finalize(self, _close_generator, self.generator.content_generator)
     
     def generate_professional_persona(self, industry: IndustryType, experience_level: ExperienceLevel) -> PersonaProfile:
         """Generate persona synchronously"""
-        return asyncio.run(self.generator.generate_professional_persona(industry, experience_level))
+        return _run_sync(self.generator.generate_professional_persona(industry, experience_level))
+
+    def generate_many(self, specs: List[tuple], use_batch_api: bool = True) -> List[PersonaProfile]:
+        """Generate several personas synchronously"""
+        return _run_sync(self.generator.generate_many(specs, use_batch_api))
+
+    def close(self):
+        """Close the underlying OpenAI client"""
+        if self._finalizer.detach():
+            _run_sync(self.generator.content_generator.aclose())
 
 class AIContentGeneratorSync:
     """Synchronous wrapper for AIContentGenerator"""
     
     def __init__(self):
         self.generator = AIContentGenerator()
+        self._finalizer = weakref.finalize(self, _close_generator, self.generator)
     
     def generate_professional_content(self, content_type: str, persona: PersonaProfile) -> GeneratedContent:
         """Generate content synchronously"""
-        return asyncio.run(self.generator.generate_professional_content(content_type, persona))
+        return _run_sync(self.generator.generate_professional_content(content_type, persona))
+
+    def close(self):
+        """Close the underlying OpenAI client"""
+        if self._finalizer.detach():
+            _run_sync(self.generator.aclose())
+
+
+@functools.lru_cache(maxsize=1)
+def get_persona_generator_sync() -> PersonaGeneratorSync:
+    """Get the shared synchronous persona generator"""
+    return PersonaGeneratorSync()
+
 
+@functools.lru_cache(maxsize=1)
+def get_content_generator_sync() -> AIContentGeneratorSync:
+    """Get the shared synchronous content generator"""
+    return AIContentGeneratorSync()
@@ -3,18 +3,42 @@ Comprehensive AI Error Handler for GPT-5 Integration
 Provides error classification, recovery strategies, and monitoring for AI operations.
 """
 
+import functools
+import itertools
 import logging
 import time
 import threading
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Tuple, Callable
+from collections import Counter, deque
+from datetime import datetime
+from typing import Deque, Dict, Any, List, Optional, Tuple, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 import re
 import json
 
+try:
+    import re2
+except ImportError:  # google-re2 is optional; without it the fused stdlib regex is used
+    re2 = None
+
 logger = logging.getLogger(__name__)
 
+# Error records kept in memory; the oldest are evicted once the history is full
+_MAX_ERROR_HISTORY = 10000
+
+# Per-minute error counters back the 1h/6h/24h statistics
+_BUCKET_SECONDS = 60
+_BUCKET_RETENTION = 24 * 60
+
+# Distinct error messages whose classification is memoized; provider errors
+# repeat verbatim during rate-limit storms and outages
+_CLASSIFY_CACHE_SIZE = 2048
+
+# Request ids, UUIDs and timestamps collapse to '*' before classification so
+# otherwise identical messages share a cache entry. Tokens need four or more
+# hex characters including a digit, which leaves 3-digit status codes intact.
+_VOLATILE_TOKEN_RE = re.compile(r"\b(?=[0-9a-f]*\d)[0-9a-f]{4,}\b")
+
 
 class AIErrorType(Enum):
     """Classification of AI-related errors."""
@@ -37,7 +61,25 @@ class ErrorSeverity(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+# Error types that typically clear up on their own
+_TRANSIENT_ERRORS = frozenset({
+    AIErrorType.RATE_LIMIT_EXCEEDED,
+    AIErrorType.MODEL_UNAVAILABLE,
+    AIErrorType.NETWORK_TIMEOUT,
+    AIErrorType.PARSING_ERROR,
+    AIErrorType.SERVER_ERROR
+})
+
+# Logging level for each error severity
+_LOG_LEVEL_BY_SEVERITY = {
+    ErrorSeverity.LOW: logging.INFO,
+    ErrorSeverity.MEDIUM: logging.WARNING,
+    ErrorSeverity.HIGH: logging.ERROR,
+    ErrorSeverity.CRITICAL: logging.CRITICAL
+}
+
+
+@dataclass(slots=True)
 class ErrorPattern:
     """Pattern for error detection and classification."""
     pattern: str
@@ -47,12 +89,18 @@ class ErrorPattern:
     retry_recommended: bool = False
     max_retries: int = 3
     retry_delay: float = 5.0
+    compiled: Any = field(init=False, repr=False)
 
+    def __post_init__(self):
+        # RE2 matches in linear time, so hostile or huge messages cannot backtrack;
+        # without it only the fused stdlib regex is used and nothing is compiled here
+        self.compiled = re2.compile("(?i)" + self.pattern) if re2 is not None else None
 
-@dataclass
+
+@dataclass(slots=True)
 class ErrorInstance:
     """Individual error occurrence record."""
-    timestamp: datetime
+    timestamp: float  # epoch seconds
     error_type: AIErrorType
     severity: ErrorSeverity
     message: str
@@ -63,10 +111,11 @@ class ErrorInstance:
     operation_type: Optional[str] = None
     retry_count: int = 0
     resolved: bool = False
-    resolution_time: Optional[datetime] = None
+    resolution_time: Optional[float] = None
+    error_id: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class RecoveryStrategy:
     """Recovery strategy for specific error types."""
     error_type: AIErrorType
@@ -81,20 +130,30 @@ class AIErrorHandler:
     
     def __init__(self):
         self._error_patterns = self._initialize_error_patterns()
+        self._combined_pattern, self._patterns_by_group = self._combine_error_patterns(self._error_patterns)
+        self._anchors = self._extract_anchors(self._error_patterns)
+        # First pattern of each type supplies its retry recommendation
+        self._pattern_by_type: Dict[AIErrorType, ErrorPattern] = {}
+        for pattern in self._error_patterns:
+            self._pattern_by_type.setdefault(pattern.error_type, pattern)
+        self._classify_message = functools.lru_cache(maxsize=_CLASSIFY_CACHE_SIZE)(self._match_error_message)
         self._recovery_strategies = self._initialize_recovery_strategies()
-        self._error_history: List[ErrorInstance] = []
-        self._error_stats: Dict[AIErrorType, Dict[str, Any]] = {}
-        self._lock = threading.RLock()
-        
-        # Initialize statistics
-        for error_type in AIErrorType:
-            self._error_stats[error_type] = {
-                'count': 0,
-                'last_occurrence': None,
-                'total_retries': 0,
-                'resolution_rate': 0.0,
-                'avg_resolution_time': 0.0
-            }
+        self._response_templates = self._build_response_templates()
+        self._error_history: Deque[ErrorInstance] = deque(maxlen=_MAX_ERROR_HISTORY)
+        self._errors_by_id: Dict[int, ErrorInstance] = {}
+        self._error_ids = itertools.count(1)  # next() is atomic, so ids are taken without the lock
+        # (error_type, severity) counts for the records in history, and per minute for the last 24h
+        self._total_counts: Counter = Counter()
+        self._buckets: Dict[int, Counter] = {}
+        # Per-type statistics as parallel lists indexed by the type's position;
+        # _stats_by_type() renders the dict shape callers see
+        self._type_index = {error_type: i for i, error_type in enumerate(AIErrorType)}
+        self._stat_counts = [0] * len(self._type_index)
+        self._stat_last_occurrence: List[Optional[float]] = [None] * len(self._type_index)
+        self._stat_resolved_counts = [0] * len(self._type_index)
+        self._stat_avg_resolution = [0.0] * len(self._type_index)
+        # Guards history, counters and stats; held only for bookkeeping
+        self._lock = threading.Lock()
         
         logger.info("AIErrorHandler initialized with comprehensive error patterns")
     
@@ -103,7 +162,7 @@ class AIErrorHandler:
         return [
             # API Key Issues
             ErrorPattern(
-                pattern=r"(?i)(invalid.*api.*key|incorrect.*api.*key|authentication.*failed|401.*unauthorized)",
+                pattern=r"(invalid.*api.*key|incorrect.*api.*key|authentication.*failed|401.*unauthorized)",
                 error_type=AIErrorType.API_KEY_INVALID,
                 severity=ErrorSeverity.CRITICAL,
                 is_transient=False,
@@ -112,7 +171,7 @@ class AIErrorHandler:
             
             # Rate Limiting
             ErrorPattern(
-                pattern=r"(?i)(rate.*limit|429|too.*many.*requests|quota.*exceeded|throttled)",
+                pattern=r"(rate.*limit|429|too.*many.*requests|quota.*exceeded|throttled)",
                 error_type=AIErrorType.RATE_LIMIT_EXCEEDED,
                 severity=ErrorSeverity.HIGH,
                 is_transient=True,
@@ -123,7 +182,7 @@ class AIErrorHandler:
             
             # Model Issues
             ErrorPattern(
-                pattern=r"(?i)(model.*unavailable|model.*not.*found|service.*unavailable|503.*service)",
+                pattern=r"(model.*unavailable|model.*not.*found|service.*unavailable|503.*service)",
                 error_type=AIErrorType.MODEL_UNAVAILABLE,
                 severity=ErrorSeverity.HIGH,
                 is_transient=True,
@@ -134,7 +193,7 @@ class AIErrorHandler:
             
             # Network/Timeout Issues
             ErrorPattern(
-                pattern=r"(?i)(timeout|connection.*timeout|read.*timeout|network.*error|connection.*reset)",
+                pattern=r"(timeout|connection.*timeout|read.*timeout|network.*error|connection.*reset)",
                 error_type=AIErrorType.NETWORK_TIMEOUT,
                 severity=ErrorSeverity.MEDIUM,
                 is_transient=True,
@@ -145,7 +204,7 @@ class AIErrorHandler:
             
             # Session Issues
             ErrorPattern(
-                pattern=r"(?i)(session.*expired|session.*closed|session.*terminated|no.*active.*session)",
+                pattern=r"(session.*expired|session.*closed|session.*terminated|no.*active.*session)",
                 error_type=AIErrorType.SESSION_EXPIRED,
                 severity=ErrorSeverity.MEDIUM,
                 is_transient=False,
@@ -156,7 +215,7 @@ class AIErrorHandler:
             
             # Browser Issues
             ErrorPattern(
-                pattern=r"(?i)(browser.*closed|browser.*disconnected|page.*closed|target.*closed)",
+                pattern=r"(browser.*closed|browser.*disconnected|page.*closed|target.*closed)",
                 error_type=AIErrorType.BROWSER_DISCONNECTED,
                 severity=ErrorSeverity.MEDIUM,
                 is_transient=False,
@@ -167,7 +226,7 @@ class AIErrorHandler:
             
             # Parsing Issues
             ErrorPattern(
-                pattern=r"(?i)(json.*decode|parse.*error|invalid.*format|malformed.*response)",
+                pattern=r"(json.*decode|parse.*error|invalid.*format|malformed.*response)",
                 error_type=AIErrorType.PARSING_ERROR,
                 severity=ErrorSeverity.LOW,
                 is_transient=True,
@@ -178,7 +237,7 @@ class AIErrorHandler:
             
             # Validation Issues
             ErrorPattern(
-                pattern=r"(?i)(validation.*failed|invalid.*input|bad.*request|400.*bad)",
+                pattern=r"(validation.*failed|invalid.*input|bad.*request|400.*bad)",
                 error_type=AIErrorType.VALIDATION_ERROR,
                 severity=ErrorSeverity.MEDIUM,
                 is_transient=False,
@@ -187,7 +246,7 @@ class AIErrorHandler:
             
             # Server Errors
             ErrorPattern(
-                pattern=r"(?i)(500.*internal.*server|502.*bad.*gateway|503.*service|504.*gateway)",
+                pattern=r"(500.*internal.*server|502.*bad.*gateway|503.*service|504.*gateway)",
                 error_type=AIErrorType.SERVER_ERROR,
                 severity=ErrorSeverity.HIGH,
                 is_transient=True,
@@ -197,6 +256,36 @@ class AIErrorHandler:
             )
         ]
     
+    @staticmethod
+    def _combine_error_patterns(patterns: List[ErrorPattern]) -> Tuple["re.Pattern", Dict[str, ErrorPattern]]:
+        """Fuse the patterns into one regex that reports which pattern matched."""
+        # Each alternative is a lookahead from the start of the message, so the
+        # first pattern in list order wins, as with trying them one by one
+        groups = {f"p{index}": pattern for index, pattern in enumerate(patterns)}
+        combined = "|".join(
+            f"(?=(?s:.*?)(?P<{name}>{pattern.pattern}))" for name, pattern in groups.items()
+        )
+        return re.compile(combined, re.IGNORECASE), groups
+    
+    @staticmethod
+    def _extract_anchors(patterns: List[ErrorPattern]) -> Optional[Tuple[str, ...]]:
+        """Literal substrings at least one of which every pattern match contains.
+        
+        Each alternative of the form ``word.*word...`` contributes its longest
+        word. Returns None (no pre-screen) if any alternative is more complex.
+        """
+        anchors = set()
+        for pattern in patterns:
+            body = pattern.pattern
+            if body.startswith("(") and body.endswith(")"):
+                body = body[1:-1]
+            for alternative in body.split("|"):
+                words = alternative.split(".*")
+                if not all(re.fullmatch(r"[\w ]+", word) for word in words):
+                    return None
+                anchors.add(max(words, key=len).lower())
+        return tuple(sorted(anchors))
+    
     def _initialize_recovery_strategies(self) -> Dict[AIErrorType, RecoveryStrategy]:
         """Initialize recovery strategies for each error type."""
         return {
@@ -313,15 +402,35 @@ class AIErrorHandler:
     
     def classify_error(self, error_message: str, context: Dict[str, Any] = None) -> Tuple[AIErrorType, ErrorSeverity]:
         """Classify error based on message and context."""
-        error_message_lower = error_message.lower()
+        # Patterns are case-insensitive, so lowercasing keeps the result
+        return self._classify_message(_VOLATILE_TOKEN_RE.sub('*', error_message.lower()))
+    
+    def _match_error_message(self, error_message: str) -> Tuple[AIErrorType, ErrorSeverity]:
+        """Match a message against the error patterns (memoized by classify_error)."""
+        # Substring screen: messages with no pattern anchor cannot match
+        message_lower = error_message.lower()
+        if self._anchors is not None and not any(anchor in message_lower for anchor in self._anchors):
+            return AIErrorType.SERVER_ERROR, ErrorSeverity.MEDIUM
         
-        for pattern in self._error_patterns:
-            if re.search(pattern.pattern, error_message, re.IGNORECASE):
+        if re2 is not None:
+            # RE2 has no lookaheads for the fused form; run the linear-time
+            # patterns in priority order instead
+            for pattern in self._error_patterns:
+                if pattern.compiled.search(error_message):
+                    return pattern.error_type, pattern.severity
+        else:
+            match = self._combined_pattern.match(error_message)
+            if match:
+                pattern = self._patterns_by_group[match.lastgroup]
                 return pattern.error_type, pattern.severity
         
         # Default classification for unmatched errors
         return AIErrorType.SERVER_ERROR, ErrorSeverity.MEDIUM
     
+    def classify_cache_info(self):
+        """Hit/miss statistics for the classification cache."""
+        return self._classify_message.cache_info()
+    
     def handle_error(self, 
                     error_message: str, 
                     context: Dict[str, Any] = None,
@@ -331,42 +440,116 @@ class AIErrorHandler:
                     stack_trace: str = None) -> Dict[str, Any]:
         """Comprehensive error handling with classification and recovery suggestions."""
         
+        # Classification and record construction touch no shared state, so
+        # they run outside the lock along with the response and logging
+        error_type, severity = self.classify_error(error_message, context)
+        
+        error_instance = ErrorInstance(
+            timestamp=time.time(),
+            error_type=error_type,
+            severity=severity,
+            message=error_message,
+            context=context or {},
+            stack_trace=stack_trace,
+            session_id=session_id,
+            account_id=account_id,
+            operation_type=operation_type,
+            error_id=next(self._error_ids)
+        )
+        
         with self._lock:
-            # Classify error
-            error_type, severity = self.classify_error(error_message, context)
-            
-            # Create error instance
-            error_instance = ErrorInstance(
-                timestamp=datetime.utcnow(),
-                error_type=error_type,
-                severity=severity,
-                message=error_message,
-                context=context or {},
-                stack_trace=stack_trace,
-                session_id=session_id,
-                account_id=account_id,
-                operation_type=operation_type
-            )
-            
-            # Store in history
-            self._error_history.append(error_instance)
-            
-            # Update statistics
-            stats = self._error_stats[error_type]
-            stats['count'] += 1
-            stats['last_occurrence'] = datetime.utcnow()
-            
-            # Get recovery strategy
+            error_count = self._record(error_instance)
+        
+        timestamp_iso = datetime.utcfromtimestamp(error_instance.timestamp).isoformat()
+        
+        # Prepare response from the per-type template, filling the per-call fields.
+        # Nested sections are copied too, so callers can't alter later responses
+        # or the recovery strategy itself
+        template = self._response_templates[error_type]
+        response = template.copy()
+        response['classification'] = template['classification'].copy()
+        recovery = response['recovery_strategy'] = template['recovery_strategy'].copy()
+        recovery['actions'] = list(recovery['actions'])
+        response['error_id'] = error_instance.error_id
+        response['severity'] = severity.value
+        response['context'] = {
+            'session_id': session_id,
+            'account_id': account_id,
+            'operation_type': operation_type,
+            'timestamp': timestamp_iso
+        }
+        response['statistics'] = {
+            'error_count': error_count,
+            'last_occurrence': timestamp_iso
+        }
+        
+        # Log error with appropriate level
+        log_level = _LOG_LEVEL_BY_SEVERITY.get(severity, logging.ERROR)
+        
+        # Lazy %-args: LOW-severity INFO lines are usually filtered, so skip formatting them
+        logger.log(log_level, "AI Error [%s]: %s", error_type.value, error_message)
+        
+        return response
+    
+    def _record(self, error_instance: ErrorInstance) -> int:
+        """Add an error to history, counters and per-type stats; callers hold the lock.
+        
+        Returns the error type's occurrence count.
+        """
+        # Store in history, dropping the evicted record from the id index
+        if len(self._error_history) == self._error_history.maxlen:
+            self._forget(self._error_history[0])
+        self._error_history.append(error_instance)
+        self._errors_by_id[error_instance.error_id] = error_instance
+        self._count(error_instance)
+        
+        i = self._type_index[error_instance.error_type]
+        self._stat_counts[i] += 1
+        self._stat_last_occurrence[i] = error_instance.timestamp
+        return self._stat_counts[i]
+    
+    def _count(self, error_instance: ErrorInstance):
+        """Bump the total and per-minute counters for a new error."""
+        key = (error_instance.error_type, error_instance.severity)
+        self._total_counts[key] += 1
+        minute = int(error_instance.timestamp // _BUCKET_SECONDS)
+        bucket = self._buckets.get(minute)
+        if bucket is None:
+            # New minute: drop buckets that fell out of the retention window
+            for stale in [m for m in self._buckets if m <= minute - _BUCKET_RETENTION]:
+                del self._buckets[stale]
+            bucket = self._buckets[minute] = Counter()
+        bucket[key] += 1
+    
+    def _forget(self, error_instance: ErrorInstance):
+        """Drop a record leaving the history from the id index and totals."""
+        self._errors_by_id.pop(error_instance.error_id, None)
+        key = (error_instance.error_type, error_instance.severity)
+        self._total_counts[key] -= 1
+        if self._total_counts[key] <= 0:
+            del self._total_counts[key]
+    
+    @staticmethod
+    def _breakdown(counts: Counter) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """Split (error_type, severity) counts into by-type and by-severity dicts."""
+        by_type: Dict[str, int] = {}
+        by_severity: Dict[str, int] = {}
+        for (error_type, severity), count in counts.items():
+            by_type[error_type.value] = by_type.get(error_type.value, 0) + count
+            by_severity[severity.value] = by_severity.get(severity.value, 0) + count
+        return by_type, by_severity
+    
+    def _build_response_templates(self) -> Dict[AIErrorType, Dict[str, Any]]:
+        """Build per-type handle_error response templates; handle_error copies them per call."""
+        templates = {}
+        for error_type in AIErrorType:
+            retry_info = self._get_retry_recommendation(error_type, "")
             recovery_strategy = self._recovery_strategies.get(error_type)
-            
-            # Get retry recommendation
-            retry_info = self._get_retry_recommendation(error_type, error_message)
-            
-            # Prepare response
-            response = {
-                'error_id': len(self._error_history),  # Simple ID
+            # Per-call keys are placeholders so copies keep the response key order
+            templates[error_type] = {
+                'error_id': None,
                 'error_type': error_type.value,
-                'severity': severity.value,
+                'severity': None,
                 'classification': {
                     'is_transient': self._is_transient_error(error_type),
                     'retry_recommended': retry_info['recommended'],
@@ -374,49 +557,23 @@ class AIErrorHandler:
                     'retry_delay': retry_info['delay']
                 },
                 'recovery_strategy': {
-                    'actions': recovery_strategy.actions if recovery_strategy else [],
+                    'actions': tuple(recovery_strategy.actions) if recovery_strategy else (),
                     'estimated_time': recovery_strategy.estimated_time if recovery_strategy else 60,
                     'success_rate': recovery_strategy.success_rate if recovery_strategy else 0.5,
                     'requires_intervention': recovery_strategy.requires_user_intervention if recovery_strategy else False
                 },
-                'context': {
-                    'session_id': session_id,
-                    'account_id': account_id,
-                    'operation_type': operation_type,
-                    'timestamp': error_instance.timestamp.isoformat()
-                },
-                'statistics': {
-                    'error_count': stats['count'],
-                    'last_occurrence': stats['last_occurrence'].isoformat() if stats['last_occurrence'] else None
-                }
+                'context': None,
+                'statistics': None
             }
-            
-            # Log error with appropriate level
-            log_level = {
-                ErrorSeverity.LOW: logging.INFO,
-                ErrorSeverity.MEDIUM: logging.WARNING,
-                ErrorSeverity.HIGH: logging.ERROR,
-                ErrorSeverity.CRITICAL: logging.CRITICAL
-            }.get(severity, logging.ERROR)
-            
-            logger.log(log_level, f"AI Error [{error_type.value}]: {error_message}")
-            
-            return response
+        return templates
     
     def _is_transient_error(self, error_type: AIErrorType) -> bool:
         """Check if error type is typically transient."""
-        transient_errors = {
-            AIErrorType.RATE_LIMIT_EXCEEDED,
-            AIErrorType.MODEL_UNAVAILABLE,
-            AIErrorType.NETWORK_TIMEOUT,
-            AIErrorType.PARSING_ERROR,
-            AIErrorType.SERVER_ERROR
-        }
-        return error_type in transient_errors
+        return error_type in _TRANSIENT_ERRORS
     
     def _get_retry_recommendation(self, error_type: AIErrorType, error_message: str) -> Dict[str, Any]:
         """Get retry recommendation for error type."""
-        pattern = next((p for p in self._error_patterns if p.error_type == error_type), None)
+        pattern = self._pattern_by_type.get(error_type)
         
         if not pattern:
             return {'recommended': False, 'max_retries': 0, 'delay': 0}
@@ -431,61 +588,76 @@ class AIErrorHandler:
         """Get comprehensive error statistics."""
         with self._lock:
             total_errors = len(self._error_history)
-            recent_errors = [e for e in self._error_history if e.timestamp > datetime.utcnow() - timedelta(hours=24)]
-            
-            severity_counts = {}
-            type_counts = {}
-            
-            for error in self._error_history:
-                severity_counts[error.severity.value] = severity_counts.get(error.severity.value, 0) + 1
-                type_counts[error.error_type.value] = type_counts.get(error.error_type.value, 0) + 1
+            type_counts, severity_counts = self._breakdown(self._total_counts)
+            error_trends = self._calculate_error_trends()
+            recent_count = error_trends['last_24_hours']['count']
             
             return {
                 'total_errors': total_errors,
-                'recent_errors_24h': len(recent_errors),
-                'error_rate_24h': len(recent_errors) / 24 if recent_errors else 0,
+                'recent_errors_24h': recent_count,
+                'error_rate_24h': recent_count / 24 if recent_count else 0,
                 'severity_breakdown': severity_counts,
                 'type_breakdown': type_counts,
                 'top_errors': sorted(type_counts.items(), key=lambda x: x[1], reverse=True)[:5],
-                'error_trends': self._calculate_error_trends(),
-                'statistics_by_type': self._error_stats.copy()
+                'error_trends': error_trends,
+                'statistics_by_type': self._stats_by_type(),
+                'classification_cache': self.classify_cache_info()._asdict()
             }
     
+    def _stats_by_type(self) -> Dict[AIErrorType, Dict[str, Any]]:
+        """Render the per-type statistics lists as one dict per error type."""
+        stats_by_type = {}
+        for error_type, i in self._type_index.items():
+            stats = {
+                'count': self._stat_counts[i],
+                'last_occurrence': datetime.utcfromtimestamp(self._stat_last_occurrence[i]) if self._stat_last_occurrence[i] else None,
+                'total_retries': 0,
+                'resolution_rate': 0.0,
+                'avg_resolution_time': self._stat_avg_resolution[i]
+            }
+            if self._stat_resolved_counts[i]:
+                stats['resolved_count'] = self._stat_resolved_counts[i]
+            stats_by_type[error_type] = stats
+        return stats_by_type
+    
     def _calculate_error_trends(self) -> Dict[str, Any]:
         """Calculate error trends over time."""
-        now = datetime.utcnow()
         periods = {
-            'last_hour': now - timedelta(hours=1),
-            'last_6_hours': now - timedelta(hours=6),
-            'last_24_hours': now - timedelta(hours=24)
+            'last_hour': 60,
+            'last_6_hours': 6 * 60,
+            'last_24_hours': 24 * 60
         }
         
+        # One pass over the minute buckets feeds every window the bucket falls in
+        current_minute = int(time.time() // _BUCKET_SECONDS)
+        window_counts = {period_name: Counter() for period_name in periods}
+        for minute, bucket in self._buckets.items():
+            age = current_minute - minute
+            for period_name, minutes in periods.items():
+                if age < minutes:
+                    window_counts[period_name].update(bucket)
+        
         trends = {}
-        for period_name, start_time in periods.items():
-            period_errors = [e for e in self._error_history if e.timestamp > start_time]
+        for period_name, period_counts in window_counts.items():
+            by_type, by_severity = self._breakdown(period_counts)
             trends[period_name] = {
-                'count': len(period_errors),
-                'by_type': {},
-                'by_severity': {}
+                'count': sum(period_counts.values()),
+                'by_type': by_type,
+                'by_severity': by_severity
             }
-            
-            for error in period_errors:
-                error_type = error.error_type.value
-                severity = error.severity.value
-                
-                trends[period_name]['by_type'][error_type] = trends[period_name]['by_type'].get(error_type, 0) + 1
-                trends[period_name]['by_severity'][severity] = trends[period_name]['by_severity'].get(severity, 0) + 1
         
         return trends
     
     def get_recent_errors(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get recent error instances."""
         with self._lock:
-            recent_errors = sorted(self._error_history, key=lambda x: x.timestamp, reverse=True)[:limit]
+            # History is in insertion order, so newest-first is a reverse walk
+            recent_errors = itertools.islice(reversed(self._error_history), limit)
             
             return [
                 {
-                    'timestamp': error.timestamp.isoformat(),
+                    'error_id': error.error_id,
+                    'timestamp': datetime.utcfromtimestamp(error.timestamp).isoformat(),
                     'error_type': error.error_type.value,
                     'severity': error.severity.value,
                     'message': error.message,
@@ -501,20 +673,20 @@ class AIErrorHandler:
     def mark_error_resolved(self, error_id: int) -> bool:
         """Mark an error as resolved."""
         with self._lock:
-            if 0 <= error_id < len(self._error_history):
-                error_instance = self._error_history[error_id]
+            error_instance = self._errors_by_id.get(error_id)
+            if error_instance is not None:
                 error_instance.resolved = True
-                error_instance.resolution_time = datetime.utcnow()
+                error_instance.resolution_time = time.time()
                 
                 # Update resolution statistics
-                stats = self._error_stats[error_instance.error_type]
-                resolution_time = (error_instance.resolution_time - error_instance.timestamp).total_seconds()
+                i = self._type_index[error_instance.error_type]
+                resolution_time = error_instance.resolution_time - error_instance.timestamp
                 
                 # Calculate running average
-                current_avg = stats.get('avg_resolution_time', 0.0)
-                current_count = stats.get('resolved_count', 0)
-                stats['avg_resolution_time'] = (current_avg * current_count + resolution_time) / (current_count + 1)
-                stats['resolved_count'] = current_count + 1
+                current_avg = self._stat_avg_resolution[i]
+                current_count = self._stat_resolved_counts[i]
+                self._stat_avg_resolution[i] = (current_avg * current_count + resolution_time) / (current_count + 1)
+                self._stat_resolved_counts[i] = current_count + 1
                 
                 logger.info(f"Error {error_id} marked as resolved after {resolution_time:.2f} seconds")
                 return True
@@ -524,12 +696,13 @@ class AIErrorHandler:
     def cleanup_old_errors(self, days: int = 7) -> int:
         """Clean up error history older than specified days."""
         with self._lock:
-            cutoff_time = datetime.utcnow() - timedelta(days=days)
-            initial_count = len(self._error_history)
+            cutoff_time = time.time() - days * 86400
+            cleaned_count = 0
             
-            self._error_history = [e for e in self._error_history if e.timestamp > cutoff_time]
+            while self._error_history and self._error_history[0].timestamp <= cutoff_time:
+                self._forget(self._error_history.popleft())
+                cleaned_count += 1
             
-            cleaned_count = initial_count - len(self._error_history)
             if cleaned_count > 0:
                 logger.info(f"Cleaned up {cleaned_count} error records older than {days} days")
             
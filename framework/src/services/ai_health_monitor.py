@@ -4,22 +4,98 @@ Provides real-time monitoring, service status tracking, and health verification.
 """
 
 import asyncio
+import random
 import threading
 import time
 import logging
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Callable
+from typing import Deque, Dict, Any, List, Optional, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 import aiohttp
 import json
 
 from .ai_config import get_ai_config, AIOperationType
+from . import jsonutil
 from .session_manager import get_session_manager
 from .ai_error_handler import get_error_handler
 
 logger = logging.getLogger(__name__)
 
+# On-demand probes reuse a result this fresh instead of hitting the service again
+_PROBE_CACHE_TTL = 5.0  # seconds
+
+# Shared request deadlines for health probes
+_TIMEOUT_HEAD = aiohttp.ClientTimeout(total=1)
+_TIMEOUT_LOCAL = aiohttp.ClientTimeout(total=5)
+_TIMEOUT_API = aiohttp.ClientTimeout(total=10)
+_TIMEOUT_COMPLETION = aiohttp.ClientTimeout(total=30)
+
+# Circuit breaker: after this many consecutive failed probes a service's
+# monitors stop probing for a cooldown that doubles per trip, up to the cap
+_BREAKER_FAILURE_THRESHOLD = 5
+_BREAKER_BASE_COOLDOWN = 60.0  # seconds
+_BREAKER_MAX_COOLDOWN = 600.0
+
+# Monitor loops back off exponentially during failure streaks, up to this cap,
+# with up to 10% of the interval as jitter so failing monitors drift apart
+_MAX_MONITOR_BACKOFF = 600.0  # seconds
+_MONITOR_JITTER = 0.1
+
+_rand = random.Random()
+
+
+def _monitor_delay(interval: float, failures: int) -> float:
+    """Seconds until a monitor's next check after `failures` consecutive failures."""
+    # The exponent is bounded so long outages can't overflow a float interval
+    backoff = min(interval * 2 ** min(failures, 16), _MAX_MONITOR_BACKOFF)
+    return backoff + _rand.uniform(0, interval * _MONITOR_JITTER)
+
+
+def _probe_failed(status: "ServiceStatus", details: Optional[Dict[str, Any]]) -> bool:
+    """Whether a probe result counts as a failure for the breaker and the backoff."""
+    # Unreachable, 5xx and 429 are failures; any other answer means the service is up
+    http_status = (details or {}).get('http_status', 0)
+    return status == ServiceStatus.UNHEALTHY or http_status >= 500 or http_status == 429
+
+
+# Health samples kept per service for get_health_history
+_HEALTH_HISTORY_SIZE = 1440
+
+# Weight of the newest check in the uptime moving average
+_UPTIME_EWMA_ALPHA = 0.05
+
+# Only running sessions are listed, so probes don't download the account's session history
+_BB_LIST_PARAMS = {'status': 'RUNNING'}
+
+def _new_http_session() -> aiohttp.ClientSession:
+    """Create a keep-alive session for health probes, on the loop that will use it."""
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=32, limit_per_host=8, keepalive_timeout=75,
+            ttl_dns_cache=600, enable_cleanup_closed=True
+        ),
+        cookie_jar=aiohttp.DummyCookieJar()
+    )
+
+
+async def _close_session_on_loop(session: aiohttp.ClientSession, loop: asyncio.AbstractEventLoop):
+    """Close a session from whichever loop the caller is on."""
+    if session.closed:
+        return
+    if loop is asyncio.get_running_loop():
+        await session.close()
+    elif loop.is_running():
+        await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(session.close(), loop))
+    else:
+        # The owning loop is gone, so nothing can await the close; drop the
+        # pooled connections directly
+        try:
+            session.connector.close()
+        except Exception as e:
+            logger.warning(f"Failed to close health-probe session of a stopped loop: {e}")
+
 
 class ServiceStatus(Enum):
     """Service health status levels."""
@@ -39,6 +115,23 @@ class HealthCheckType(Enum):
     ERROR_RATE = "error_rate"
 
 
+class CircuitState(Enum):
+    """Circuit breaker states for probed services."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class CircuitBreaker:
+    """Consecutive-failure breaker guarding a service's monitor probes."""
+    state: CircuitState = CircuitState.CLOSED
+    failure_count: int = 0
+    opened_at: float = 0.0  # monotonic time the breaker opened or went half-open
+    cooldown_s: float = 0.0
+    trips: int = 0  # consecutive openings, for the cooldown backoff
+
+
 @dataclass
 class HealthMetric:
     """Individual health metric."""
@@ -48,6 +141,13 @@ class HealthMetric:
     timestamp: datetime
     threshold: Optional[float] = None
     details: Dict[str, Any] = field(default_factory=dict)
+    # Rendered once here; history dumps would otherwise format every sample
+    timestamp_iso: str = field(init=False, repr=False)
+    status_value: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.timestamp_iso = self.timestamp.isoformat()
+        self.status_value = self.status.value
 
 
 @dataclass
@@ -61,6 +161,9 @@ class ServiceHealth:
     response_time_ms: Optional[float] = None
     error_count_24h: int = 0
     last_error: Optional[str] = None
+    breaker: CircuitBreaker = field(default_factory=CircuitBreaker)
+    # Every sample in time order; metrics above keeps only the latest per name
+    history: Deque[HealthMetric] = field(default_factory=lambda: deque(maxlen=_HEALTH_HISTORY_SIZE))
 
 
 class AIHealthMonitor:
@@ -74,7 +177,15 @@ class AIHealthMonitor:
         self._services: Dict[str, ServiceHealth] = {}
         self._monitoring_tasks: Dict[str, asyncio.Task] = {}
         self._health_history: List[Dict[str, Any]] = []
-        self._lock = threading.RLock()
+        self._last_probe: Dict[str, float] = {}  # service -> monotonic time of last update
+        # Monitors and on-demand checks update from different threads/loops;
+        # held only for the bookkeeping itself, never re-entered
+        self._lock = threading.Lock()
+        self._openai_headers = {'Authorization': f'Bearer {self.ai_config.api_key}'}
+        # Keep-alive session for the background monitors, bound to the loop
+        # they run on; on-demand checks use a session scoped to their call
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._http_loop: Optional[asyncio.AbstractEventLoop] = None
         
         # Configuration
         self._check_intervals = {
@@ -154,31 +265,58 @@ class AIHealthMonitor:
                 logger.info(f"Stopped monitoring task: {task_name}")
         
         self._monitoring_tasks.clear()
+        await self._close_monitor_session()
+    
+    async def _monitor_session(self) -> aiohttp.ClientSession:
+        """Get the monitors' keep-alive session for the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http.closed or self._http_loop is not loop:
+            await self._close_monitor_session()
+            self._http = _new_http_session()
+            self._http_loop = loop
+        return self._http
+    
+    async def _close_monitor_session(self):
+        """Close the monitors' session on the loop that owns it."""
+        session, loop = self._http, self._http_loop
+        self._http = None
+        self._http_loop = None
+        if session is not None:
+            await _close_session_on_loop(session, loop)
     
     async def _monitor_api_connectivity(self):
         """Monitor OpenAI API connectivity."""
         interval = self._check_intervals[HealthCheckType.API_CONNECTIVITY]
+        failures = 0
         
         while True:
+            cooldown = self._probe_wait('openai_api')
+            if cooldown:
+                # Breaker open: skip probing, leave the last result as it is and
+                # wake when the cooldown ends
+                await asyncio.sleep(cooldown)
+                continue
+            
             try:
                 start_time = time.time()
                 
                 # Test API connectivity with a simple request
-                async with aiohttp.ClientSession() as session:
-                    headers = {'Authorization': f'Bearer {self.ai_config.api_key}'}
-                    async with session.get(
-                        'https://api.openai.com/v1/models',
-                        headers=headers,
-                        timeout=aiohttp.ClientTimeout(total=10)
-                    ) as response:
-                        response_time = (time.time() - start_time) * 1000
-                        
-                        if response.status == 200:
-                            status = ServiceStatus.HEALTHY
-                            details = {'models_available': True}
-                        else:
-                            status = ServiceStatus.DEGRADED
-                            details = {'http_status': response.status}
+                session = await self._monitor_session()
+                async with session.get(
+                    'https://api.openai.com/v1/models',
+                    headers=self._openai_headers,
+                    timeout=_TIMEOUT_API
+                ) as response:
+                    # Drain the body so the connection goes back to the pool
+                    await response.read()
+                    response_time = (time.time() - start_time) * 1000
+                    
+                    if response.status == 200:
+                        status = ServiceStatus.HEALTHY
+                        details = {'models_available': True}
+                    else:
+                        status = ServiceStatus.DEGRADED
+                        details = {'http_status': response.status}
                 
                 self._update_service_health(
                     'openai_api',
@@ -187,54 +325,63 @@ class AIHealthMonitor:
                     details=details
                 )
                 
+                # Overload and rate-limit answers extend the streak like errors do
+                failures = failures + 1 if _probe_failed(status, details) else 0
+                
             except Exception as e:
+                failures += 1
                 self._update_service_health(
                     'openai_api',
                     ServiceStatus.UNHEALTHY,
                     error=str(e)
                 )
             
-            await asyncio.sleep(interval)
+            await asyncio.sleep(_monitor_delay(interval, failures))
     
     async def _monitor_model_availability(self):
         """Monitor GPT-5 model availability."""
         interval = self._check_intervals[HealthCheckType.MODEL_AVAILABILITY]
+        failures = 0
         
         while True:
+            cooldown = self._probe_wait('openai_api')
+            if cooldown:
+                # Breaker open: skip probing, leave the last result as it is and
+                # wake when the cooldown ends
+                await asyncio.sleep(cooldown)
+                continue
+            
             try:
                 start_time = time.time()
                 
                 # Test model with a minimal request
                 config = self.ai_config.get_config(AIOperationType.DEBUG_ANALYSIS)
                 
-                async with aiohttp.ClientSession() as session:
-                    headers = {
-                        'Authorization': f'Bearer {self.ai_config.api_key}',
-                        'Content-Type': 'application/json'
-                    }
-                    
-                    test_payload = {
-                        'model': config.model,
-                        'messages': [{'role': 'user', 'content': 'Test'}],
-                        'max_tokens': 5,
-                        'temperature': 0
-                    }
+                test_payload = {
+                    'model': config.model,
+                    'messages': [{'role': 'user', 'content': 'Test'}],
+                    'max_tokens': 5,
+                    'temperature': 0
+                }
+                
+                # json= sets the Content-Type header
+                session = await self._monitor_session()
+                async with session.post(
+                    'https://api.openai.com/v1/chat/completions',
+                    headers=self._openai_headers,
+                    json=test_payload,
+                    timeout=_TIMEOUT_COMPLETION
+                ) as response:
+                    response_time = (time.time() - start_time) * 1000
                     
-                    async with session.post(
-                        'https://api.openai.com/v1/chat/completions',
-                        headers=headers,
-                        json=test_payload,
-                        timeout=aiohttp.ClientTimeout(total=30)
-                    ) as response:
-                        response_time = (time.time() - start_time) * 1000
-                        
-                        if response.status == 200:
-                            status = ServiceStatus.HEALTHY
-                            details = {'model_responsive': True, 'model': config.model}
-                        else:
-                            status = ServiceStatus.DEGRADED
-                            error_text = await response.text()
-                            details = {'http_status': response.status, 'error': error_text}
+                    if response.status == 200:
+                        await response.read()
+                        status = ServiceStatus.HEALTHY
+                        details = {'model_responsive': True, 'model': config.model}
+                    else:
+                        status = ServiceStatus.DEGRADED
+                        error_text = await response.text()
+                        details = {'http_status': response.status, 'error': error_text}
                 
                 self._update_service_health(
                     'openai_api',
@@ -244,7 +391,11 @@ class AIHealthMonitor:
                     metric_name='model_availability'
                 )
                 
+                # Overload and rate-limit answers extend the streak like errors do
+                failures = failures + 1 if _probe_failed(status, details) else 0
+                
             except Exception as e:
+                failures += 1
                 self._update_service_health(
                     'openai_api',
                     ServiceStatus.UNHEALTHY,
@@ -252,11 +403,12 @@ class AIHealthMonitor:
                     metric_name='model_availability'
                 )
             
-            await asyncio.sleep(interval)
+            await asyncio.sleep(_monitor_delay(interval, failures))
     
     async def _monitor_session_health(self):
         """Monitor session manager health."""
         interval = self._check_intervals[HealthCheckType.SESSION_HEALTH]
+        failures = 0
         
         while True:
             try:
@@ -291,37 +443,48 @@ class AIHealthMonitor:
                     details=details
                 )
                 
+                failures = 0
+                
             except Exception as e:
+                failures += 1
                 self._update_service_health(
                     'session_manager',
                     ServiceStatus.UNHEALTHY,
                     error=str(e)
                 )
             
-            await asyncio.sleep(interval)
+            await asyncio.sleep(_monitor_delay(interval, failures))
     
     async def _monitor_stagehand_server(self):
         """Monitor Stagehand server health."""
         interval = self._check_intervals[HealthCheckType.STAGEHAND_SERVER]
+        failures = 0
         
         while True:
+            cooldown = self._probe_wait('stagehand_server')
+            if cooldown:
+                # Breaker open: skip probing, leave the last result as it is and
+                # wake when the cooldown ends
+                await asyncio.sleep(cooldown)
+                continue
+            
             try:
                 start_time = time.time()
                 
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(
-                        'http://localhost:8081/health',
-                        timeout=aiohttp.ClientTimeout(total=5)
-                    ) as response:
-                        response_time = (time.time() - start_time) * 1000
-                        
-                        if response.status == 200:
-                            data = await response.json()
-                            status = ServiceStatus.HEALTHY
-                            details = {'server_response': data}
-                        else:
-                            status = ServiceStatus.DEGRADED
-                            details = {'http_status': response.status}
+                session = await self._monitor_session()
+                async with session.get(
+                    'http://localhost:8081/health',
+                    timeout=_TIMEOUT_LOCAL
+                ) as response:
+                    body = await response.read()
+                    response_time = (time.time() - start_time) * 1000
+                    
+                    if response.status == 200:
+                        status = ServiceStatus.HEALTHY
+                        details = {'server_response': jsonutil.loads(body)}
+                    else:
+                        status = ServiceStatus.DEGRADED
+                        details = {'http_status': response.status}
                 
                 self._update_service_health(
                     'stagehand_server',
@@ -330,44 +493,58 @@ class AIHealthMonitor:
                     details=details
                 )
                 
+                # Overload and rate-limit answers extend the streak like errors do
+                failures = failures + 1 if _probe_failed(status, details) else 0
+                
             except Exception as e:
+                failures += 1
                 self._update_service_health(
                     'stagehand_server',
                     ServiceStatus.UNHEALTHY,
                     error=str(e)
                 )
             
-            await asyncio.sleep(interval)
+            await asyncio.sleep(_monitor_delay(interval, failures))
     
     async def _monitor_browserbase(self):
         """Monitor Browserbase connectivity."""
         interval = self._check_intervals[HealthCheckType.BROWSERBASE_CONNECTIVITY]
+        failures = 0
         
         while True:
+            cooldown = self._probe_wait('browserbase')
+            if cooldown:
+                # Breaker open: skip probing, leave the last result as it is and
+                # wake when the cooldown ends
+                await asyncio.sleep(cooldown)
+                continue
+            
             try:
                 start_time = time.time()
                 
                 # Test Browserbase API connectivity
-                import os
-                api_key = os.getenv('BROWSERBASE_API_KEY')
+                api_key = self.ai_config.get_env('BROWSERBASE_API_KEY')
                 if not api_key:
                     raise ValueError("BROWSERBASE_API_KEY not configured")
                 
-                async with aiohttp.ClientSession() as session:
-                    headers = {'x-bb-api-key': api_key}
-                    async with session.get(
-                        'https://api.browserbase.com/v1/sessions',
-                        headers=headers,
-                        timeout=aiohttp.ClientTimeout(total=10)
-                    ) as response:
-                        response_time = (time.time() - start_time) * 1000
-                        
-                        if response.status == 200:
-                            status = ServiceStatus.HEALTHY
-                            details = {'api_accessible': True}
-                        else:
-                            status = ServiceStatus.DEGRADED
-                            details = {'http_status': response.status}
+                session = await self._monitor_session()
+                headers = {'x-bb-api-key': api_key}
+                async with session.get(
+                    'https://api.browserbase.com/v1/sessions',
+                    headers=headers,
+                    params=_BB_LIST_PARAMS,
+                    timeout=_TIMEOUT_API
+                ) as response:
+                    # Drain the (status-filtered) body so the connection goes back to the pool
+                    await response.read()
+                    response_time = (time.time() - start_time) * 1000
+                    
+                    if response.status == 200:
+                        status = ServiceStatus.HEALTHY
+                        details = {'api_accessible': True}
+                    else:
+                        status = ServiceStatus.DEGRADED
+                        details = {'http_status': response.status}
                 
                 self._update_service_health(
                     'browserbase',
@@ -376,18 +553,23 @@ class AIHealthMonitor:
                     details=details
                 )
                 
+                # Overload and rate-limit answers extend the streak like errors do
+                failures = failures + 1 if _probe_failed(status, details) else 0
+                
             except Exception as e:
+                failures += 1
                 self._update_service_health(
                     'browserbase',
                     ServiceStatus.UNHEALTHY,
                     error=str(e)
                 )
             
-            await asyncio.sleep(interval)
+            await asyncio.sleep(_monitor_delay(interval, failures))
     
     async def _monitor_error_rates(self):
         """Monitor system error rates."""
         interval = self._check_intervals[HealthCheckType.ERROR_RATE]
+        failures = 0
         
         while True:
             try:
@@ -418,14 +600,17 @@ class AIHealthMonitor:
                     details=details
                 )
                 
+                failures = 0
+                
             except Exception as e:
+                failures += 1
                 self._update_service_health(
                     'error_handler',
                     ServiceStatus.UNHEALTHY,
                     error=str(e)
                 )
             
-            await asyncio.sleep(interval)
+            await asyncio.sleep(_monitor_delay(interval, failures))
     
     def _update_service_health(self, 
                              service_name: str, 
@@ -440,9 +625,14 @@ class AIHealthMonitor:
             if not service:
                 return
             
+            self._record_probe_result(service_name, service.breaker, _probe_failed(status, details))
+            
+            now = datetime.utcnow()
+            
             # Update basic status
             service.status = status
-            service.last_check = datetime.utcnow()
+            service.last_check = now
+            self._last_probe[service_name] = time.monotonic()
             service.response_time_ms = response_time_ms
             
             if error:
@@ -454,37 +644,66 @@ class AIHealthMonitor:
                 name=metric_name,
                 value=status.value,
                 status=status,
-                timestamp=datetime.utcnow(),
+                timestamp=now,
                 details=details or {}
             )
             
             service.metrics[metric_name] = metric
+            service.history.append(metric)
             
-            # Calculate uptime (simplified)
-            healthy_checks = sum(1 for m in service.metrics.values() if m.status == ServiceStatus.HEALTHY)
-            total_checks = len(service.metrics)
-            if total_checks > 0:
-                service.uptime_percentage = (healthy_checks / total_checks) * 100
-            
-            # Log status changes
-            logger.info(f"Service {service_name} health: {status.value} "
-                       f"(response: {response_time_ms}ms)" if response_time_ms else "")
+            # Uptime as an exponentially weighted share of healthy checks
+            healthy = 100.0 if status == ServiceStatus.HEALTHY else 0.0
+            service.uptime_percentage += _UPTIME_EWMA_ALPHA * (healthy - service.uptime_percentage)
+        
+        # Log status changes
+        logger.info(f"Service {service_name} health: {status.value} "
+                   f"(response: {response_time_ms}ms)" if response_time_ms else "")
+    
+    def _probe_wait(self, service_name: str) -> float:
+        """Check the service's breaker before a monitor probe.
+        
+        Returns 0 when the probe may run, otherwise the seconds left in the
+        cooldown. An open breaker lets one half-open probe through once its
+        cooldown has passed; further probes wait for that probe's result.
+        """
+        with self._lock:
+            breaker = self._services[service_name].breaker
+            if breaker.state == CircuitState.CLOSED:
+                return 0.0
+            now = time.monotonic()
+            remaining = breaker.opened_at + breaker.cooldown_s - now
+            if remaining > 0:
+                return remaining
+            # Cooldown over (or a half-open probe never reported back): try one probe
+            breaker.state = CircuitState.HALF_OPEN
+            breaker.opened_at = now
+            return 0.0
+    
+    @staticmethod
+    def _record_probe_result(service_name: str, breaker: CircuitBreaker, failed: bool):
+        """Advance a breaker after a probe; callers hold the lock."""
+        if not failed:
+            if breaker.state != CircuitState.CLOSED:
+                logger.info(f"Circuit for {service_name} closed after a successful probe")
+            breaker.state = CircuitState.CLOSED
+            breaker.failure_count = 0
+            breaker.trips = 0
+            return
+        
+        breaker.failure_count += 1
+        if breaker.state == CircuitState.HALF_OPEN or breaker.failure_count >= _BREAKER_FAILURE_THRESHOLD:
+            breaker.cooldown_s = min(_BREAKER_BASE_COOLDOWN * 2 ** breaker.trips, _BREAKER_MAX_COOLDOWN)
+            breaker.state = CircuitState.OPEN
+            breaker.opened_at = time.monotonic()
+            breaker.trips += 1
+            logger.warning(f"Circuit for {service_name} opened after {breaker.failure_count} failed probes; "
+                           f"pausing probes for {breaker.cooldown_s:.0f}s")
     
     def get_overall_health(self) -> Dict[str, Any]:
         """Get overall system health status."""
         with self._lock:
-            # Calculate overall status
             service_statuses = [s.status for s in self._services.values()]
             
-            if all(s == ServiceStatus.HEALTHY for s in service_statuses):
-                overall_status = ServiceStatus.HEALTHY
-            elif any(s == ServiceStatus.UNHEALTHY for s in service_statuses):
-                overall_status = ServiceStatus.UNHEALTHY
-            elif any(s == ServiceStatus.DEGRADED for s in service_statuses):
-                overall_status = ServiceStatus.DEGRADED
-            else:
-                overall_status = ServiceStatus.UNKNOWN
-            
             # Get service summary
             service_summary = {}
             for name, service in self._services.items():
@@ -494,19 +713,33 @@ class AIHealthMonitor:
                     'uptime_percentage': service.uptime_percentage,
                     'response_time_ms': service.response_time_ms,
                     'error_count_24h': service.error_count_24h,
-                    'last_error': service.last_error
-                }
-            
-            return {
-                'overall_status': overall_status.value,
-                'timestamp': datetime.utcnow().isoformat(),
-                'services': service_summary,
-                'system_metrics': {
-                    'active_sessions': len(self.session_manager.get_active_sessions()),
-                    'total_errors_24h': sum(s.error_count_24h for s in self._services.values()),
-                    'average_uptime': sum(s.uptime_percentage for s in self._services.values()) / len(self._services)
+                    'last_error': service.last_error,
+                    'circuit_breaker': {
+                        'state': service.breaker.state.value,
+                        'failure_count': service.breaker.failure_count
+                    }
                 }
+        
+        # Calculate overall status
+        if all(s == ServiceStatus.HEALTHY for s in service_statuses):
+            overall_status = ServiceStatus.HEALTHY
+        elif any(s == ServiceStatus.UNHEALTHY for s in service_statuses):
+            overall_status = ServiceStatus.UNHEALTHY
+        elif any(s == ServiceStatus.DEGRADED for s in service_statuses):
+            overall_status = ServiceStatus.DEGRADED
+        else:
+            overall_status = ServiceStatus.UNKNOWN
+        
+        return {
+            'overall_status': overall_status.value,
+            'timestamp': datetime.utcnow().isoformat(),
+            'services': service_summary,
+            'system_metrics': {
+                'active_sessions': len(self.session_manager.get_active_sessions()),
+                'total_errors_24h': sum(s['error_count_24h'] for s in service_summary.values()),
+                'average_uptime': sum(s['uptime_percentage'] for s in service_summary.values()) / len(service_summary)
             }
+        }
     
     def get_service_health(self, service_name: str) -> Optional[Dict[str, Any]]:
         """Get detailed health information for specific service."""
@@ -519,8 +752,8 @@ class AIHealthMonitor:
             for metric_name, metric in service.metrics.items():
                 metrics_data[metric_name] = {
                     'value': metric.value,
-                    'status': metric.status.value,
-                    'timestamp': metric.timestamp.isoformat(),
+                    'status': metric.status_value,
+                    'timestamp': metric.timestamp_iso,
                     'details': metric.details
                 }
             
@@ -532,116 +765,161 @@ class AIHealthMonitor:
                 'response_time_ms': service.response_time_ms,
                 'error_count_24h': service.error_count_24h,
                 'last_error': service.last_error,
+                'circuit_breaker': {
+                    'state': service.breaker.state.value,
+                    'failure_count': service.breaker.failure_count,
+                    'cooldown_s': service.breaker.cooldown_s
+                },
                 'metrics': metrics_data
             }
     
     def get_health_history(self, hours: int = 24) -> List[Dict[str, Any]]:
         """Get health status history."""
+        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+        
+        # Collect the samples under the lock; samples are never mutated, so
+        # formatting and sorting happen after it is released
+        samples = []
         with self._lock:
-            cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-            
-            history = []
             for service_name, service in self._services.items():
-                for metric_name, metric in service.metrics.items():
-                    if metric.timestamp > cutoff_time:
-                        history.append({
-                            'timestamp': metric.timestamp.isoformat(),
-                            'service': service_name,
-                            'metric': metric_name,
-                            'status': metric.status.value,
-                            'value': metric.value,
-                            'details': metric.details
-                        })
-            
-            return sorted(history, key=lambda x: x['timestamp'], reverse=True)
+                # Samples are in time order, so walk back from the newest and stop at the cutoff
+                for metric in reversed(service.history):
+                    if metric.timestamp <= cutoff_time:
+                        break
+                    samples.append((service_name, metric))
+        
+        history = [
+            {
+                'timestamp': metric.timestamp_iso,
+                'service': service_name,
+                'metric': metric.name,
+                'status': metric.status_value,
+                'value': metric.value,
+                'details': metric.details
+            }
+            for service_name, metric in samples
+        ]
+        return sorted(history, key=lambda x: x['timestamp'], reverse=True)
     
     async def run_health_check(self, service_name: Optional[str] = None) -> Dict[str, Any]:
         """Run immediate health check for service(s)."""
-        if service_name:
-            if service_name == 'openai_api':
-                await self._check_openai_health()
-            elif service_name == 'stagehand_server':
-                await self._check_stagehand_health()
-            elif service_name == 'browserbase':
-                await self._check_browserbase_health()
+        # Routes call this on short-lived loops, so the session lives for this
+        # call only and is shared by the probes it runs
+        async with _new_http_session() as session:
+            if service_name:
+                if service_name == 'openai_api':
+                    await self._check_openai_health(session)
+                elif service_name == 'stagehand_server':
+                    await self._check_stagehand_health(session)
+                elif service_name == 'browserbase':
+                    await self._check_browserbase_health(session)
+                
+                return self.get_service_health(service_name) or {}
             
-            return self.get_service_health(service_name) or {}
-        else:
-            # Run all health checks
-            await asyncio.gather(
-                self._check_openai_health(),
-                self._check_stagehand_health(),
-                self._check_browserbase_health(),
-                return_exceptions=True
-            )
-            return self.get_overall_health()
+            # Run all health checks; the checks record their own failures,
+            # so the group only sees the unexpected
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    tg.create_task(self._check_openai_health(session))
+                    tg.create_task(self._check_stagehand_health(session))
+                    tg.create_task(self._check_browserbase_health(session))
+            except* Exception as eg:
+                logger.error(f"Health check failed unexpectedly: {eg.exceptions}")
+        return self.get_overall_health()
+    
+    def _probe_is_fresh(self, service_name: str) -> bool:
+        """Check if the service was probed recently enough to skip a new probe."""
+        last = self._last_probe.get(service_name)
+        return last is not None and time.monotonic() - last < _PROBE_CACHE_TTL
     
-    async def _check_openai_health(self):
+    async def _check_openai_health(self, session: aiohttp.ClientSession):
         """Immediate OpenAI health check."""
+        # Skip while fresh, or while the breaker holds probes off
+        if self._probe_is_fresh('openai_api') or self._probe_wait('openai_api'):
+            return
         try:
             start_time = time.time()
-            async with aiohttp.ClientSession() as session:
-                headers = {'Authorization': f'Bearer {self.ai_config.api_key}'}
-                async with session.get(
-                    'https://api.openai.com/v1/models',
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    response_time = (time.time() - start_time) * 1000
-                    
-                    if response.status == 200:
-                        status = ServiceStatus.HEALTHY
-                    else:
-                        status = ServiceStatus.DEGRADED
+            async with session.get(
+                'https://api.openai.com/v1/models',
+                headers=self._openai_headers,
+                timeout=_TIMEOUT_API
+            ) as response:
+                await response.read()
+                response_time = (time.time() - start_time) * 1000
+                http_status = response.status
+                
+                if http_status == 200:
+                    status = ServiceStatus.HEALTHY
+                else:
+                    status = ServiceStatus.DEGRADED
             
-            self._update_service_health('openai_api', status, response_time_ms=response_time)
+            self._update_service_health('openai_api', status, response_time_ms=response_time,
+                                        details={'http_status': http_status})
             
         except Exception as e:
             self._update_service_health('openai_api', ServiceStatus.UNHEALTHY, error=str(e))
     
-    async def _check_stagehand_health(self):
+    async def _check_stagehand_health(self, session: aiohttp.ClientSession):
         """Immediate Stagehand health check."""
+        # Skip while fresh, or while the breaker holds probes off
+        if self._probe_is_fresh('stagehand_server') or self._probe_wait('stagehand_server'):
+            return
         try:
             start_time = time.time()
-            async with aiohttp.ClientSession() as session:
+            # Only the status matters here, so probe with HEAD and a tight
+            # timeout; fall back to GET for servers that don't route HEAD
+            async with session.head(
+                'http://localhost:8081/health',
+                timeout=_TIMEOUT_HEAD
+            ) as response:
+                http_status = response.status
+            if http_status in (405, 501):
                 async with session.get(
                     'http://localhost:8081/health',
-                    timeout=aiohttp.ClientTimeout(total=5)
+                    timeout=_TIMEOUT_LOCAL
                 ) as response:
-                    response_time = (time.time() - start_time) * 1000
-                    
-                    if response.status == 200:
-                        status = ServiceStatus.HEALTHY
-                    else:
-                        status = ServiceStatus.DEGRADED
+                    await response.read()
+                    http_status = response.status
+            response_time = (time.time() - start_time) * 1000
             
-            self._update_service_health('stagehand_server', status, response_time_ms=response_time)
+            if http_status == 200:
+                status = ServiceStatus.HEALTHY
+            else:
+                status = ServiceStatus.DEGRADED
+            
+            self._update_service_health('stagehand_server', status, response_time_ms=response_time,
+                                        details={'http_status': http_status})
             
         except Exception as e:
             self._update_service_health('stagehand_server', ServiceStatus.UNHEALTHY, error=str(e))
     
-    async def _check_browserbase_health(self):
+    async def _check_browserbase_health(self, session: aiohttp.ClientSession):
         """Immediate Browserbase health check."""
+        # Skip while fresh, or while the breaker holds probes off
+        if self._probe_is_fresh('browserbase') or self._probe_wait('browserbase'):
+            return
         try:
             start_time = time.time()
-            import os
-            api_key = os.getenv('BROWSERBASE_API_KEY')
+            api_key = self.ai_config.get_env('BROWSERBASE_API_KEY')
             
-            async with aiohttp.ClientSession() as session:
-                headers = {'x-bb-api-key': api_key}
-                async with session.get(
-                    'https://api.browserbase.com/v1/sessions',
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    response_time = (time.time() - start_time) * 1000
-                    
-                    if response.status == 200:
-                        status = ServiceStatus.HEALTHY
-                    else:
-                        status = ServiceStatus.DEGRADED
+            headers = {'x-bb-api-key': api_key}
+            async with session.get(
+                'https://api.browserbase.com/v1/sessions',
+                headers=headers,
+                params=_BB_LIST_PARAMS,
+                timeout=_TIMEOUT_API
+            ) as response:
+                await response.read()
+                response_time = (time.time() - start_time) * 1000
+                http_status = response.status
+                
+                if http_status == 200:
+                    status = ServiceStatus.HEALTHY
+                else:
+                    status = ServiceStatus.DEGRADED
             
-            self._update_service_health('browserbase', status, response_time_ms=response_time)
+            self._update_service_health('browserbase', status, response_time_ms=response_time,
+                                        details={'http_status': http_status})
             
         except Exception as e:
             self._update_service_health('browserbase', ServiceStatus.UNHEALTHY, error=str(e))
@@ -1,7 +1,9 @@
 import aiohttp
 import asyncio
+import json
 import logging
 import random
+import re
 import string
 import socket
 from dataclasses import dataclass
@@ -10,6 +12,9 @@ from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# Subject keywords that mark a LinkedIn verification email
+_VERIFICATION_SUBJECT_RE = re.compile(r'linkedin|verify|confirm|activation', re.IGNORECASE)
+
 @dataclass
 class EmailResult:
     """Result of email creation process"""
@@ -102,7 +107,6 @@ class EmailVerificationManager:
         """Create a realistic email via PRO API (create_email)."""
         try:
             def sanitize_handle(s: str) -> str:
-                import re
                 s = s.lower()
                 s = re.sub(r"[^a-z0-9]", "", s)  # alphanumeric only
                 return s
@@ -208,8 +212,7 @@ class EmailVerificationManager:
                 # Read once and try JSON parse, then fallback to text markers
                 content = await response.text()
                 try:
-                    import json as _json
-                    data = _json.loads(content)
+                    data = json.loads(content)
                     messages = []
                     # Expect a list of headers with msg_id
                     for msg in data if isinstance(data, list) else data.get('messages', []):
@@ -241,8 +244,6 @@ class EmailVerificationManager:
 
     def extract_verification_link(self, email_body: str) -> Optional[str]:
         """Extract verification link from email body"""
-        import re
-        
         # Common LinkedIn verification link patterns
         patterns = [
             r'https://www\.linkedin\.com/checkpoint/challenge/[^\s<>"]+',
@@ -263,8 +264,6 @@ class EmailVerificationManager:
 
     def extract_verification_code(self, email_body: str) -> Optional[str]:
         """Extract verification code from email body"""
-        import re
-        
         # Common verification code patterns
         patterns = [
             r'verification code[:\s]*(\d{4,8})',
@@ -305,17 +304,12 @@ class EmailVerificationManager:
 
     def is_linkedin_verification_email(self, message: EmailMessage) -> bool:
         """Check if message is a LinkedIn verification email"""
-        linkedin_indicators = [
-            'linkedin' in message.sender.lower(),
-            'linkedin' in message.subject.lower(),
-            'verify' in message.subject.lower(),
-            'confirm' in message.subject.lower(),
-            'activation' in message.subject.lower(),
-            message.verification_link is not None,
-            message.verification_code is not None
-        ]
-        
-        return any(linkedin_indicators)
+        return (
+            message.verification_link is not None
+            or message.verification_code is not None
+            or 'linkedin' in message.sender.lower()
+            or _VERIFICATION_SUBJECT_RE.search(message.subject) is not None
+        )
 
     async def delete_email(self, email: str) -> bool:
         """Delete email address via PRO API (text response)."""
@@ -1,6 +1,7 @@
 import aiohttp
 import asyncio
 import logging
+import re
 from dataclasses import dataclass
 from typing import Optional
 from datetime import datetime, timedelta
@@ -87,14 +88,8 @@ class SMSVerificationManager:
         The caller should invoke poll_for_sms(activation_id) later when verification is needed.
         """
         try:
-            # Step 1: Check balance
-            balance = await self.check_balance()
-            if balance is None:
-                raise InsufficientBalanceError("5SIM balance unavailable (network error)")
-            if balance < 0.12:  # Cost per French number
-                raise InsufficientBalanceError(f"Insufficient balance: {balance}")
-
-            # Step 2: Request French number for LinkedIn
+            # Request the French number for LinkedIn directly; the buy endpoint
+            # rejects insufficient balance itself, so no separate balance probe
             payload = {
                 "country": "france",
                 "product": "linkedin",
@@ -119,7 +114,10 @@ class SMSVerificationManager:
                         success=True
                     )
                 else:
-                    error_msg = f"Failed to acquire number: {response.status}"
+                    body = (await response.text()).strip()
+                    if 'not enough user balance' in body.lower():
+                        raise InsufficientBalanceError(f"Insufficient balance: {body}")
+                    error_msg = f"Failed to acquire number: {response.status} {body}".rstrip()
                     logger.error(error_msg)
                     return SMSResult(
                         phone_number="",
@@ -180,8 +178,6 @@ class SMSVerificationManager:
 
     def extract_verification_code(self, sms_text: str) -> Optional[str]:
         """Extract verification code from SMS text"""
-        import re
-        
         # Common patterns for verification codes
         patterns = [
             r'\b(\d{6})\b',  # 6-digit code
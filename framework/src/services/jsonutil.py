@@ -0,0 +1,20 @@
+"""
+JSON codec shared by the AI services.
+Uses orjson when it is installed and falls back to the stdlib json module.
+"""
+
+from typing import Any
+
+try:
+    import orjson
+
+    loads = orjson.loads
+
+    def dumps(obj: Any) -> str:
+        """Serialize obj to a JSON string."""
+        return orjson.dumps(obj).decode()
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    import json
+
+    loads = json.loads
+    dumps = json.dumps
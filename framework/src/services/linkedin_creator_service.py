@@ -22,13 +22,14 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
-# Optional AI-native browser stack (Stagehand + Browserbase)
+# Optional AI-native browser stack (Skyvern)
 try:
-    from src.services.ai_browser_agent import AIBrowserAgent  # type: ignore
+    from src.services.ai_browser_agent import AIBrowserAgent, drain_cleanups  # type: ignore
     from src.services.linkedin_ai_engine import LinkedInAIEngine  # type: ignore
     _AI_AVAILABLE = True
 except Exception:
     AIBrowserAgent = None  # type: ignore
+    drain_cleanups = None  # type: ignore
     LinkedInAIEngine = None  # type: ignore
     _AI_AVAILABLE = False
 
@@ -447,6 +448,11 @@ async def create_linkedin_account_async(account_id: str) -> Dict[str, Any]:
         
         progress.send_completion(True, result)
         
+        # The remote browser close runs in the background; let it finish before
+        # the caller's event loop shuts down and cancels it
+        if browser_agent:
+            await drain_cleanups()
+        
         logger.info(f"LinkedIn account creation completed successfully for {account_id}")
         return result
         
@@ -482,6 +488,9 @@ async def create_linkedin_account_async(account_id: str) -> Dict[str, Any]:
         except Exception as cleanup_error:
             logger.warning(f"Failed to cleanup browser session: {cleanup_error}")
         
+        if browser_agent:
+            await drain_cleanups()
+        
         return {
             'success': False,
             'error': str(e),
@@ -1,9 +1,12 @@
 import asyncio
 import logging
+import socket
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 
+import aiohttp
+
 from src.config import config
 from src.services.fivesim import SMSVerificationManager, SMSResult
 from src.services.emailondeck import EmailVerificationManager, EmailResult, EmailMessage
@@ -250,28 +253,23 @@ class ServiceManager:
         try:
             # Preflight connectivity checks
             try:
-                import aiohttp, socket
                 timeout = aiohttp.ClientTimeout(total=8, connect=4, sock_connect=4, sock_read=4)
                 connector = aiohttp.TCPConnector(family=socket.AF_INET, ttl_dns_cache=120)
                 async with aiohttp.ClientSession(timeout=timeout, connector=connector) as sess:
-                    ok_5sim = False
-                    ok_eod = False
-                    ok_probe = False
-                    try:
-                        async with sess.get('https://5sim.net/v1/guest/countries') as r:
-                            ok_5sim = (r.status == 200)
-                    except Exception as e:
-                        self._emit_enhanced(account_id, [{'level': 'error', 'message': f"Préflight 5SIM échec: {e}"}])
-                    try:
-                        async with sess.get('https://api.emailondeck.com/api.php?act=ping') as r:
-                            ok_eod = (r.status in (200, 400, 401))
-                    except Exception as e:
-                        self._emit_enhanced(account_id, [{'level': 'error', 'message': f"Préflight EmailOnDeck échec: {e}"}])
-                    try:
-                        async with sess.get('https://ifconfig.me/ip') as r:
-                            ok_probe = (r.status == 200)
-                    except Exception as e:
-                        self._emit_enhanced(account_id, [{'level': 'error', 'message': f"Préflight réseau échec: {e}"}])
+                    # Probes target independent hosts, so run them concurrently
+                    async def _probe(url, ok_statuses, label):
+                        try:
+                            async with sess.get(url) as r:
+                                return r.status in ok_statuses
+                        except Exception as e:
+                            self._emit_enhanced(account_id, [{'level': 'error', 'message': f"Préflight {label} échec: {e}"}])
+                            return False
+
+                    ok_5sim, ok_eod, ok_probe = await asyncio.gather(
+                        _probe('https://5sim.net/v1/guest/countries', (200,), '5SIM'),
+                        _probe('https://api.emailondeck.com/api.php?act=ping', (200, 400, 401), 'EmailOnDeck'),
+                        _probe('https://ifconfig.me/ip', (200,), 'réseau'),
+                    )
                     self._emit_enhanced(account_id, [{'level': 'info', 'message': f"Préflight: 5SIM={'OK' if ok_5sim else 'FAIL'}, EmailOnDeck={'OK' if ok_eod else 'FAIL'}, InternetProbe={'OK' if ok_probe else 'FAIL'}"}], overall_progress=8)
             except Exception:
                 pass
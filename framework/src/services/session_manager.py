@@ -14,10 +14,18 @@ from enum import Enum
 import weakref
 import uuid
 
-from .ai_config import AIOperationType, get_skyvern_client
+from .ai_config import AIOperationType, SkyvernClient, get_skyvern_client
 
 logger = logging.getLogger(__name__)
 
+# A session is only flagged as errored after this many consecutive errors
+# within the window, so one transient failure doesn't force a re-creation.
+_ERROR_THRESHOLD = 2
+_ERROR_WINDOW = timedelta(seconds=10)
+
+# Upper bound on concurrent remote closes during an expiry sweep
+_MAX_CONCURRENT_CLOSES = 8
+
 
 class SessionStatus(Enum):
     """Session status tracking."""
@@ -45,6 +53,8 @@ class SessionMetadata:
     total_operations: int = 0
     skyvern_session_id: Optional[str] = None
     tags: Set[str] = field(default_factory=set)
+    consecutive_errors: int = 0
+    last_error_at: Optional[datetime] = None
     
     def update_activity(self):
         """Update last activity timestamp."""
@@ -58,13 +68,21 @@ class SessionMetadata:
     def increment_operation(self):
         """Increment operation counter and update activity."""
         self.total_operations += 1
+        self.consecutive_errors = 0
         self.update_activity()
     
     def record_error(self, error_message: str):
-        """Record an error occurrence."""
+        """Record an error occurrence, flagging the session only on repeated failures."""
+        now = datetime.utcnow()
+        if self.last_error_at and now - self.last_error_at <= _ERROR_WINDOW:
+            self.consecutive_errors += 1
+        else:
+            self.consecutive_errors = 1
         self.error_count += 1
         self.last_error = error_message
-        self.status = SessionStatus.ERROR
+        self.last_error_at = now
+        if self.consecutive_errors >= _ERROR_THRESHOLD:
+            self.status = SessionStatus.ERROR
         self.update_activity()
 
 
@@ -89,6 +107,11 @@ class SessionManager:
         
         logger.info("SessionManager initialized with background cleanup")
     
+    @property
+    def skyvern_client(self) -> SkyvernClient:
+        """Skyvern client used for this manager's browser sessions."""
+        return self._skyvern_client
+    
     def _start_cleanup_task(self):
         """Start background cleanup task."""
         try:
@@ -260,7 +283,6 @@ class SessionManager:
         """Clean up expired sessions."""
         with self._lock:
             expired_sessions = []
-            current_time = datetime.utcnow()
             
             for session_id, session in list(self._sessions.items()):
                 # Check if session is expired
@@ -269,17 +291,12 @@ class SessionManager:
                     expired_sessions.append(session_id)
             
             # Remove expired sessions
+            removed_sessions = []
             cleanup_results = []
             for session_id in expired_sessions:
                 session = self._sessions.pop(session_id, None)
                 if session:
-                    # Close Skyvern session
-                    if session.skyvern_session_id:
-                        try:
-                            await self._skyvern_client.close_browser_session(browser_session_id=session.skyvern_session_id)
-                            logger.info(f"Closed Skyvern session {session.skyvern_session_id}")
-                        except Exception as e:
-                            logger.error(f"Failed to close Skyvern session {session.skyvern_session_id}: {e}")
+                    removed_sessions.append(session)
 
                     # Remove from account mapping
                     if session.account_id and session.account_id in self._account_sessions:
@@ -292,7 +309,24 @@ class SessionManager:
                         'live_url': session.live_url,
                         'skyvern_session_id': session.skyvern_session_id
                     })
-            
+        
+        # Close Skyvern sessions concurrently, outside the lock
+        close_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_CLOSES)
+
+        async def _close_skyvern_session(skyvern_session_id: str):
+            async with close_semaphore:
+                try:
+                    await self._skyvern_client.close_browser_session(browser_session_id=skyvern_session_id)
+                    logger.info(f"Closed Skyvern session {skyvern_session_id}")
+                except Exception as e:
+                    logger.error(f"Failed to close Skyvern session {skyvern_session_id}: {e}")
+
+        await asyncio.gather(*(
+            _close_skyvern_session(session.skyvern_session_id)
+            for session in removed_sessions if session.skyvern_session_id
+        ))
+        
+        with self._lock:
             # Update statistics
             self._stats['total_expired'] += len(cleanup_results)
             self._stats['active_sessions'] = len([s for s in self._sessions.values() if s.status not in [SessionStatus.EXPIRED, SessionStatus.CLEANUP]])